@@ -6,9 +6,35 @@ from django.urls import path
 from django.shortcuts import render, redirect
 import zipfile
 from django.contrib import admin, messages
-import tempfile
-import os,csv,json
+import io
+import csv,json
+from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+
+# Component fields an upload row overwrites
+_ROW_FIELDS = ("parent", "name", "legend", "suffix", "object", "grips")
+
+
+def _snapshot(component):
+    """Field values and file names a failing row must put back on a queued instance."""
+    values = {field: getattr(component, field) for field in _ROW_FIELDS}
+    return values, component.svg.name, component.png.name
+
+
+def _restore(component, snapshot):
+    values, component.svg.name, component.png.name = snapshot
+    for field, value in values.items():
+        setattr(component, field, value)
+
+
+def _delete_files(files):
+    """Delete (storage, name) pairs, ignoring files that are already gone."""
+    for storage, name in files:
+        storage.delete(name)
+
 
 # -----------------------------
 # Project Admin
@@ -41,40 +67,40 @@ class ComponentAdmin(admin.ModelAdmin):
                 messages.error(request, "Please upload a valid ZIP file.")
                 return redirect("admin:component_upload_zip")
 
-            # Create temp directory to extract ZIP
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with zipfile.ZipFile(zip_file) as zf:
-                    zf.extractall(temp_dir)
+            # Read entries straight out of the uploaded archive (no extraction to disk)
+            with zipfile.ZipFile(zip_file) as zf:
+                names = [n for n in zf.namelist() if not n.endswith("/")]
                 
                 # Find components folder (case insensitive)
                 components_dir = None
-                for item in os.listdir(temp_dir):
-                    if os.path.isdir(os.path.join(temp_dir, item)) and item.lower() == "components":
-                        components_dir = os.path.join(temp_dir, item)
+                for name in names:
+                    top = name.split("/", 1)[0]
+                    if "/" in name and top.lower() == "components":
+                        components_dir = top
                         break
                 
                 if not components_dir:
                     messages.error(request, "Components folder not found in ZIP.")
                     return redirect("admin:component_upload_zip")
                 
-                # Find CSV file
+                # Split the folder's contents into direct files and sub-folders
+                prefix = components_dir + "/"
                 csv_file = None
-                for item in os.listdir(components_dir):
-                    if item.lower().endswith('.csv'):
-                        csv_file = os.path.join(components_dir, item)
-                        break
+                folder_map = {}
+                for name in names:
+                    if not name.startswith(prefix):
+                        continue
+                    rel = name[len(prefix):]
+                    if "/" in rel:
+                        folder = rel.split("/", 1)[0]
+                        folder_map.setdefault(folder.lower(), prefix + folder)
+                    elif csv_file is None and rel.lower().endswith('.csv'):
+                        csv_file = name
                 
                 if not csv_file:
                     messages.error(request, "CSV file not found in components folder.")
                     return redirect("admin:component_upload_zip")
                 
-                # Map folder names to actual paths
-                folder_map = {}
-                for item in os.listdir(components_dir):
-                    item_path = os.path.join(components_dir, item)
-                    if os.path.isdir(item_path):
-                        folder_map[item.lower()] = item_path
-                
                 # Check required folders
                 required_folders = ['svg', 'png']
                 missing_folders = [f for f in required_folders if f not in folder_map]
@@ -85,91 +111,137 @@ class ComponentAdmin(admin.ModelAdmin):
                 
                 svg_dir = folder_map['svg']
                 png_dir = folder_map['png']
+                entries = set(names)
+
+                with zf.open(csv_file) as raw, io.TextIOWrapper(raw, encoding="utf-8-sig", newline="") as csvfile:
+                    rows = list(csv.DictReader(csvfile))
+
+                # Fetch every existing component for this upload in one query
+                s_nos = {row.get("s_no") for row in rows if row.get("s_no")}
+                existing = Component.objects.in_bulk(s_nos, field_name="s_no")
 
-                with open(csv_file, newline="", encoding="utf-8-sig") as csvfile:
-                    reader = csv.DictReader(csvfile)
-                    success_count = 0
-                    update_count = 0
-                    create_count = 0
+                # Rows are collected per s_no, then written with bulk_create / bulk_update
+                pending = {}
+                to_create = {}
+                to_update = {}
+                # Files written for queued rows, and the files they replace. Old files are
+                # only removed once the rows pointing at the new ones are committed.
+                new_files = []
+                old_files = []
+
+                for row in rows:
+                    component_name = row.get("name")
+                    s_no = row.get("s_no")
+                    
+                    # Skip rows without name or s_no
+                    if not component_name or not s_no:
+                        messages.warning(request, f"Skipping row missing name or s_no: {row}")
+                        continue
                     
-                    for row in reader:
-                        component_name = row.get("name")
-                        s_no = row.get("s_no")
+                    svg_path = f"{svg_dir}/{component_name}.svg"
+                    png_path = f"{png_dir}/{component_name}.png"
+                    row_files = []
+                    snapshot = None
+                    
+                    try:
+                        grips = row.get("grips")  # from CSV
+                        if grips:
+                            try:
+                                grips = json.loads(grips)
+                            except json.JSONDecodeError:
+                                print(f"Invalid JSON format for grips in component '{component_name}'. Setting grips to empty list.")
+                                grips = []
+
+                        else:
+                            grips = []
+                        
+                        component = pending.get(s_no) or existing.get(s_no)
+                        if component is not None:
+                            # An earlier row may have queued this instance: keep its values
+                            # so a row that fails below leaves it as that row set it
+                            snapshot = _snapshot(component)
+                            # Update existing component
+                            component.parent = row.get("parent", component.parent)
+                            component.name = component_name
+                            component.legend = row.get("legend", component.legend)
+                            component.suffix = row.get("suffix", component.suffix)
+                            component.object = row.get("object", component.object)
+                            component.grips =  grips
+                        else:
+                            # Create new component
+                            component = Component(
+                                s_no=s_no,
+                                parent=row.get("parent"),
+                                name=component_name,
+                                legend=row.get("legend"),
+                                suffix=row.get("suffix"),
+                                object=row.get("object"),
+                                grips= grips,
+                            )
+
+                        # Catch field errors (lengths, nulls) now, so one bad row is skipped
+                        # instead of failing the bulk write. s_no uniqueness is already
+                        # handled by the prefetch; packs may leave parent empty.
+                        component.full_clean(exclude=["parent", "svg", "png"], validate_unique=False)
+
+                        replaced = []
+                        # Update SVG if file exists
+                        if svg_path in entries:
+                            if component.svg:
+                                replaced.append((component.svg.storage, component.svg.name))
+                            with zf.open(svg_path) as f:
+                                component.svg.save(f"{component_name}.svg", File(f), save=False)
+                            row_files.append((component.svg.storage, component.svg.name))
                         
-                        # Skip rows without name or s_no
-                        if not component_name or not s_no:
-                            messages.warning(request, f"Skipping row missing name or s_no: {row}")
-                            continue
+                        # Update PNG if file exists
+                        if png_path in entries:
+                            if component.png:
+                                replaced.append((component.png.storage, component.png.name))
+                            with zf.open(png_path) as f:
+                                component.png.save(f"{component_name}.png", File(f), save=False)
+                            row_files.append((component.png.storage, component.png.name))
                         
-                        svg_path = os.path.join(svg_dir, f"{component_name}.svg")
-                        png_path = os.path.join(png_dir, f"{component_name}.png")
+                        pending[s_no] = component
+                        if component.pk is None:
+                            to_create[s_no] = component
+                        else:
+                            to_update[s_no] = component
+                        new_files.extend(row_files)
+                        old_files.extend(replaced)
                         
-                        try:
-                            # Check if component with this s_no already exists
-                            existing_component = Component.objects.filter(s_no=s_no).first()
-                            grips = row.get("grips")  # from CSV
-                            if grips:
-                                try:
-                                    print("Grips data:", grips)
-                                    grips = json.loads(grips)
-                                except json.JSONDecodeError:
-                                    print(f"Invalid JSON format for grips in component '{component_name}'. Setting grips to empty list.")
-                                    grips = []
-
-                            else:
-                                grips = []
-                            
-                            if existing_component:
-                                # Update existing component
-                                component = existing_component
-                                component.parent = row.get("parent", component.parent)
-                                component.name = component_name
-                                component.legend = row.get("legend", component.legend)
-                                component.suffix = row.get("suffix", component.suffix)
-                                component.object = row.get("object", component.object)
-                                component.grips =  grips
-                                update_count += 1
-                            else:
-                                # Create new component
-                                component = Component(
-                                    s_no=s_no,
-                                    parent=row.get("parent"),
-                                    name=component_name,
-                                    legend=row.get("legend"),
-                                    suffix=row.get("suffix"),
-                                    object=row.get("object"),
-                                    grips= grips,
-                                )
-                                create_count += 1
-                            
-                            # Update SVG if file exists
-                            if os.path.exists(svg_path):
-                                # Delete old SVG file if exists
-                                if component.svg and hasattr(component.svg, 'name'):
-                                    old_svg_path = component.svg.path
-                                    if os.path.exists(old_svg_path):
-                                        os.remove(old_svg_path)
-                                
-                                with open(svg_path, "rb") as f:
-                                    component.svg.save(f"{component_name}.svg", File(f), save=False)
-                            
-                            # Update PNG if file exists
-                            if os.path.exists(png_path):
-                                # Delete old PNG file if exists
-                                if component.png and hasattr(component.png, 'name'):
-                                    old_png_path = component.png.path
-                                    if os.path.exists(old_png_path):
-                                        os.remove(old_png_path)
-                                
-                                with open(png_path, "rb") as f:
-                                    component.png.save(f"{component_name}.png", File(f), save=False)
-                            
-                            component.save()
-                            success_count += 1
-                            
-                        except Exception as e:
-                            messages.warning(request, f"Error saving component '{component_name}': {str(e)}")
+                    except ValidationError as e:
+                        if snapshot is not None:
+                            _restore(component, snapshot)
+                        messages.warning(request, f"Skipping component '{component_name}': {'; '.join(e.messages)}")
+                    except Exception as e:
+                        if snapshot is not None:
+                            _restore(component, snapshot)
+                        _delete_files(row_files)
+                        messages.warning(request, f"Error saving component '{component_name}': {str(e)}")
+
+                update_count = len(to_update)
+                create_count = len(to_create)
+                try:
+                    batch_size = settings.COMPONENT_BULK_BATCH_SIZE
+                    with transaction.atomic():
+                        Component.objects.bulk_create(to_create.values(), batch_size=batch_size)
+                        # bulk_update() bypasses auto_now, so stamp updated_at by hand
+                        now = timezone.now()
+                        for component in to_update.values():
+                            component.updated_at = now
+                        Component.objects.bulk_update(
+                            to_update.values(),
+                            [*_ROW_FIELDS, "svg", "png", "updated_at"],
+                            batch_size=batch_size,
+                        )
+                        transaction.on_commit(lambda: _delete_files(old_files))
+                except Exception as e:
+                    # Nothing was written, so the rows still point at the old files
+                    _delete_files(new_files)
+                    messages.error(request, f"Error saving components: {str(e)}")
+                    return redirect("admin:component_upload_zip")
                 
+                success_count = update_count + create_count
                 if success_count > 0:
                     message = f"Successfully processed {success_count} components"
                     if update_count > 0:
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -152,3 +153,6 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+
+# Rows per INSERT/UPDATE when the admin ZIP upload writes components in bulk
+COMPONENT_BULK_BATCH_SIZE = int(os.environ.get('COMPONENT_BULK_BATCH_SIZE', '1000'))
@@ -12,11 +12,41 @@ from django.core.files import File
 from api.models import Component
 from api.admin import ComponentAdmin
 from django.urls import reverse
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import IntegrityError
+import math
+import os
+import shutil
+import tempfile
+
+
+# Fixture payload for the upload tests, encoded once at import time
+_CSV_BYTES = b"""s_no,parent,name,legend,suffix,object,grips
+1,,Resistor,R,R,,"""
 
 
 class ComponentAdminMinimalTest(TestCase):
     """Minimal tests for ComponentAdmin upload."""
     
+    @classmethod
+    def setUpClass(cls):
+        # Uploaded SVG/PNG files go to a throwaway MEDIA_ROOT, removed after the class
+        cls.media_root = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=cls.media_root)
+        media.enable()
+        cls.addClassCleanup(media.disable)
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        """Build the test zip once for the whole class."""
+        # Kept as immutable bytes: each SimpleUploadedFile wraps them in a
+        # BytesIO that shares the buffer instead of copying it.
+        cls._zip_bytes = cls.create_test_zip()
+
     def setUp(self):
         # Create admin user
         User.objects.create_superuser(
@@ -26,28 +56,24 @@ class ComponentAdminMinimalTest(TestCase):
         )
         self.client.login(username='admin', password='password')
     
-    def create_test_zip(self):
-        """Create a simple test zip with one component."""
-        csv_content = """s_no,parent,name,legend,suffix,object,grips
-1,,Resistor,R,R,,"""
-        
+    @staticmethod
+    def create_test_zip():
+        """Create a simple test zip with one component and return its bytes."""
         zip_buffer = BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w') as zf:
-            zf.writestr('components/components.csv', csv_content)
+        # Payload is a few bytes: store, don't deflate
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zf:
+            zf.writestr('components/components.csv', _CSV_BYTES)
             zf.writestr('components/svg/Resistor.svg', '<svg>Resistor</svg>')
             zf.writestr('components/png/Resistor.png', b'PNG')
         
-        zip_buffer.seek(0)
-        return zip_buffer
+        return zip_buffer.getvalue()
     
     def test_successful_upload(self):
         """Test that upload works with valid zip."""
-        zip_buffer = self.create_test_zip()
-        
         url = reverse('admin:component_upload_zip')
         zip_file = SimpleUploadedFile(
             'test.zip',
-            zip_buffer.getvalue(),
+            self._zip_bytes,
             content_type='application/zip'
         )
         
@@ -60,6 +86,138 @@ class ComponentAdminMinimalTest(TestCase):
         self.assertEqual(Component.objects.count(), 1)
         self.assertEqual(Component.objects.first().name, 'Resistor')
     
+    def test_no_temp_dir_created(self):
+        """Test that the upload is read from the archive without extracting it."""
+        url = reverse('admin:component_upload_zip')
+        zip_file = SimpleUploadedFile(
+            'test.zip',
+            self._zip_bytes,
+            content_type='application/zip'
+        )
+        
+        with patch('tempfile.mkdtemp') as mkdtemp:
+            response = self.client.post(url, {'zip_file': zip_file})
+        
+        mkdtemp.assert_not_called()
+        self.assertRedirects(response, reverse('admin:api_component_changelist'))
+        component = Component.objects.get(s_no='1')
+        self.assertTrue(component.svg.name.endswith('.svg'))
+        self.assertEqual(component.svg.read(), b'<svg>Resistor</svg>')
+    
+    @staticmethod
+    def create_bulk_zip(n_rows, start=0):
+        """Create a zip whose CSV holds ``n_rows`` components."""
+        rows = (f"{i},,Part{i},P,P,," for i in range(start, start + n_rows))
+        csv_bytes = ("s_no,parent,name,legend,suffix,object,grips\n" + "\n".join(rows)).encode()
+        zip_buffer = BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zf:
+            zf.writestr('components/components.csv', csv_bytes)
+            zf.writestr(f'components/svg/Part{start}.svg', '<svg>Part</svg>')
+            zf.writestr(f'components/png/Part{start}.png', b'PNG')
+        return zip_buffer.getvalue()
+
+    def _count_writes(self, zip_bytes, verb):
+        """Upload ``zip_bytes`` and return how many ``verb`` statements hit the components table."""
+        url = reverse('admin:component_upload_zip')
+        zip_file = SimpleUploadedFile('bulk.zip', zip_bytes, content_type='application/zip')
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(url, {'zip_file': zip_file})
+        # Read the log before assertRedirects() issues another request and resets it
+        queries = [q['sql'] for q in ctx.captured_queries]
+        self.assertRedirects(response, reverse('admin:api_component_changelist'))
+        table = Component._meta.db_table
+        return sum(1 for sql in queries if sql.lstrip().upper().startswith(verb) and table in sql)
+
+    @staticmethod
+    def _batches(n_rows, batch_size):
+        """Statements Django needs for ``n_rows``, after the backend's own parameter cap."""
+        fields = [f for f in Component._meta.concrete_fields if not f.primary_key]
+        batch_size = min(batch_size, connection.ops.bulk_batch_size(fields, [None] * n_rows))
+        return math.ceil(n_rows / batch_size)
+
+    @override_settings(COMPONENT_BULK_BATCH_SIZE=1000)
+    def test_bulk_upload_one_insert_per_batch(self):
+        """Test that new components are inserted one statement per batch."""
+        start = 0
+        for n_rows in (100, 2_500):
+            with self.subTest(n_rows=n_rows):
+                inserts = self._count_writes(self.create_bulk_zip(n_rows, start), 'INSERT')
+                self.assertEqual(inserts, self._batches(n_rows, 1000))
+                start += n_rows
+                self.assertEqual(Component.objects.count(), start)
+
+    @override_settings(COMPONENT_BULK_BATCH_SIZE=40)
+    def test_bulk_upload_updates_existing(self):
+        """Test that re-uploading a pack updates rows in batches instead of inserting."""
+        zip_bytes = self.create_bulk_zip(100)
+        self.assertEqual(self._count_writes(zip_bytes, 'INSERT'), self._batches(100, 40))
+        self.assertEqual(self._count_writes(zip_bytes, 'INSERT'), 0)
+        self.assertEqual(self._count_writes(zip_bytes, 'UPDATE'), math.ceil(100 / 40))
+        self.assertEqual(Component.objects.count(), 100)
+        self.assertTrue(Component.objects.get(s_no='0').svg.name.endswith('.svg'))
+
+    @staticmethod
+    def create_rows_zip(rows):
+        """Create a zip with an SVG and PNG for every ``(s_no, name)`` in ``rows``."""
+        lines = "\n".join(f"{s_no},,{name},P,P," for s_no, name in rows)
+        zip_buffer = BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zf:
+            zf.writestr('components/components.csv', "s_no,parent,name,legend,suffix,object,grips\n" + lines)
+            for _, name in rows:
+                zf.writestr(f'components/svg/{name}.svg', f'<svg>{name}</svg>')
+                zf.writestr(f'components/png/{name}.png', b'PNG')
+        return zip_buffer.getvalue()
+
+    def _upload(self, zip_bytes):
+        url = reverse('admin:component_upload_zip')
+        zip_file = SimpleUploadedFile('rows.zip', zip_bytes, content_type='application/zip')
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(url, {'zip_file': zip_file})
+
+    def _media_files(self):
+        return sorted(os.listdir(os.path.join(self.media_root, 'components')))
+
+    def test_bad_row_skipped_others_kept(self):
+        """Test that a row failing validation is skipped while the rest of the pack is saved."""
+        self._upload(self.create_rows_zip([('1', 'Pump')]))
+        old_svg = Component.objects.get(s_no='1').svg.name
+
+        # s_no is longer than the column allows
+        response = self._upload(self.create_rows_zip([('1', 'Pump'), ('12345678901', 'Bad'), ('2', 'Valve')]))
+
+        self.assertRedirects(response, reverse('admin:api_component_changelist'))
+        self.assertEqual(sorted(Component.objects.values_list('s_no', flat=True)), ['1', '2'])
+        for component in Component.objects.all():
+            self.assertEqual(component.svg.read(), f'<svg>{component.name}</svg>'.encode())
+            self.assertTrue(component.png.storage.exists(component.png.name))
+        # The replaced file went away once the update committed; the bad row left nothing behind
+        self.assertFalse(Component.objects.get(s_no='1').svg.storage.exists(old_svg))
+        self.assertFalse([name for name in self._media_files() if name.startswith('Bad')])
+
+    def test_invalid_duplicate_row_keeps_first(self):
+        """Test that an invalid repeat of an s_no leaves the earlier row's values to be saved."""
+        long_name = 'X' * 101  # longer than Component.name allows
+        response = self._upload(self.create_rows_zip([('3', 'Pump'), ('3', long_name)]))
+
+        self.assertRedirects(response, reverse('admin:api_component_changelist'))
+        component = Component.objects.get(s_no='3')
+        self.assertEqual(component.name, 'Pump')
+        self.assertEqual(component.svg.read(), b'<svg>Pump</svg>')
+        self.assertFalse([name for name in self._media_files() if name.startswith('X')])
+
+    def test_failed_write_keeps_old_files(self):
+        """Test that a failed bulk write removes the new files and keeps the ones rows point at."""
+        self._upload(self.create_rows_zip([('1', 'Pump')]))
+        before = self._media_files()
+
+        with patch.object(Component.objects, 'bulk_create', side_effect=IntegrityError('boom')):
+            response = self._upload(self.create_rows_zip([('1', 'Pump'), ('2', 'Valve')]))
+
+        self.assertRedirects(response, reverse('admin:component_upload_zip'))
+        self.assertEqual(self._media_files(), before)
+        component = Component.objects.get(s_no='1')
+        self.assertEqual(component.svg.read(), b'<svg>Pump</svg>')
+
     def test_no_file_upload(self):
         """Test error when no file is uploaded."""
         url = reverse('admin:component_upload_zip')
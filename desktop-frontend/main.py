@@ -1,12 +1,12 @@
 import sys
-from PyQt5.QtWidgets import QApplication, QStackedWidget
+from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt, QCoreApplication
 
 import src.app_state as app_state
 from src.screens import WelcomeScreen, LoginScreen, CreateAccScreen
 from src.canvas_screen import CanvasScreen
 from src.landing_page import LandingPage
-from src.navigation import slide_to_index
+from src.navigation import slide_to_index, ScreenStack, ScreenRegistry
 
 
 def load_stylesheet(app):
@@ -27,35 +27,24 @@ def main():
     QApplication.setStyle('Fusion')
     load_stylesheet(app)
 
-    stacked = QStackedWidget()
+    stacked = ScreenStack()
     stacked.setMinimumSize(1200, 800)
 
-    # open maximized or fullscreen
-    stacked.showMaximized()   # or 
-    # stacked.showFullScreen()
-
     # Expose stacked widget globally for navigation/toast
     app_state.widget = stacked
 
+    # Login / sign-up screens are only built the first time they are opened
     welcome = WelcomeScreen()
-    login = LoginScreen()
-    create = CreateAccScreen()
     landing = LandingPage()
     canvas = CanvasScreen()
 
-    app_state.screens = {
-    "welcome": welcome,
-    "login": login,
-    "create": create,
-    "landing": landing,
-    "canvas": canvas
-    }
-
-    stacked.addWidget(welcome)  # index 0
-    stacked.addWidget(login)    # index 1
-    stacked.addWidget(create)   # index 2
-    stacked.addWidget(landing)  # index 3
-    stacked.addWidget(canvas)   # index 4
+    stacked.add_screen("welcome", welcome)            # index 0
+    stacked.add_lazy_screen("login", LoginScreen)     # index 1
+    stacked.add_lazy_screen("create", CreateAccScreen) # index 2
+    stacked.add_screen("landing", landing)            # index 3
+    stacked.add_screen("canvas", canvas)              # index 4
+
+    app_state.screens = ScreenRegistry(stacked)
     
     # Connect landing page signal
     landing.new_project_clicked.connect(lambda: slide_to_index(4))
@@ -70,7 +59,11 @@ def main():
     landing.open_project_clicked.connect(handle_landing_open)
 
     stacked.setCurrentIndex(0)
-    stacked.show()
+
+    # Show once, after every eager screen is in place, so the window's first
+    # paint happens with its final contents; open maximized or fullscreen
+    stacked.showMaximized()   # or 
+    # stacked.showFullScreen()
 
     sys.exit(app.exec_())
 
@@ -3,7 +3,8 @@ Export utilities for canvas content.
 """
 import json
 import os
-import pandas as pd
+import struct
+import zlib
 from PyQt5.QtCore import Qt, QRectF, QPoint, QSizeF, QSize
 from PyQt5.QtGui import QPainter, QImage, QPageSize, QRegion, QColor
 from PyQt5.QtWidgets import QWidget, QLabel
@@ -327,7 +328,7 @@ def load_canvas_from_project(canvas, project_data):
                     end_side = _get_grip_side(end_comp, eg)
                     conn.set_end_grip(end_comp, eg, end_side)
                 
-                conn.update_path(canvas.components, canvas.connections)
+                conn.update_path(canvas.components, canvas.connections, getattr(canvas, "segment_index", None))
                 canvas.connections.append(conn)
         
         canvas.update()
@@ -379,55 +380,135 @@ def _get_grip_side(component, grip_index):
 
 def get_content_rect(canvas, padding=50):
     """Calculates the bounding rectangle of all canvas content."""
-    content_rect = QRectF()
+    # Gather plain edge coordinates and reduce once, instead of growing a
+    # QRectF with united() per component / path point.
+    xs = []
+    ys = []
     for comp in canvas.components:
-        content_rect = content_rect.united(QRectF(comp.geometry()))
-        
+        g = comp.geometry()
+        xs += (g.x(), g.x() + g.width())
+        ys += (g.y(), g.y() + g.height())
+
     for conn in canvas.connections:
-        if not conn.path: continue
         for p in conn.path:
-            content_rect = content_rect.united(QRectF(p.x(), p.y(), 1, 1))
+            xs += (p.x(), p.x() + 1)
+            ys += (p.y(), p.y() + 1)
+
+    if not xs:
+        return QRectF(canvas.rect())
 
-    if content_rect.isEmpty():
+    left, top, right, bottom = min(xs), min(ys), max(xs), max(ys)
+    if right <= left or bottom <= top:
         return QRectF(canvas.rect())
         
-    content_rect.adjust(-padding, -padding, padding, padding)
-    return content_rect
+    # Pad the scalars and build the result once
+    return QRectF(left - padding, top - padding,
+                  right - left + 2 * padding, bottom - top + 2 * padding)
+
+def _paint_content(painter, canvas, rect, scale=1.0, visible=None):
+    """Paints the given canvas area (connections + components) onto any painter.
+    visible: optional canvas-space rect; components outside it are skipped."""
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setRenderHint(QPainter.SmoothPixmapTransform)
+    painter.setRenderHint(QPainter.TextAntialiasing)
+    painter.setRenderHint(QPainter.HighQualityAntialiasing)
+    
+    painter.scale(scale, scale)
+    painter.translate(-rect.topLeft())
+    
+    # Draw Connections
+    painter.save()
+    if hasattr(canvas, 'zoom_level'):
+        z = canvas.zoom_level
+        painter.scale(z, z)
+    canvas_painter.draw_connections(painter, canvas.connections, canvas.components)
+    painter.restore()
+    
+    # Draw Components
+    for comp in canvas.components:
+        if visible is not None and not visible.intersects(QRectF(comp.geometry())):
+            continue
+        painter.save()
+        painter.translate(comp.pos())
+        comp.render(painter, QPoint(), QRegion(), QWidget.DrawChildren)
+        painter.restore()
 
 def render_to_image(canvas, rect, scale=1.0):
     """Renders the specified canvas area to a QImage."""
     img_size = rect.size().toSize() * scale
-    image = QImage(img_size, QImage.Format_ARGB32)
+    # Background is filled opaque white, so skip the alpha channel entirely;
+    # RGB32 is also the raster engine's native compositing format.
+    image = QImage(img_size, QImage.Format_RGB32)
     image.fill(Qt.white)
     
     painter = QPainter(image)
     try:
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        painter.setRenderHint(QPainter.TextAntialiasing)
-        painter.setRenderHint(QPainter.HighQualityAntialiasing)
-        
-        painter.scale(scale, scale)
-        painter.translate(-rect.topLeft())
-        
-        # Draw Connections
-        painter.save()
-        if hasattr(canvas, 'zoom_level'):
-            z = canvas.zoom_level
-            painter.scale(z, z)
-        canvas_painter.draw_connections(painter, canvas.connections, canvas.components)
-        painter.restore()
-        
-        # Draw Components
-        for comp in canvas.components:
-            painter.save()
-            painter.translate(comp.pos())
-            comp.render(painter, QPoint(), QRegion(), QWidget.DrawChildren)
-            painter.restore()
+        _paint_content(painter, canvas, rect, scale)
     finally:
         painter.end()
     return image
 
+# Exports larger than this are rendered in horizontal bands and streamed to
+# PNG, so peak memory stays at one band instead of the whole image.
+BAND_HEIGHT = 1024
+BANDED_EXPORT_MIN_PIXELS = 4096 * 4096
+
+# Canvas coordinates are logical pixels at the standard screen density
+LOGICAL_DPI = 96
+
+def _write_png_chunk(f, tag, data):
+    f.write(struct.pack(">I", len(data)))
+    f.write(tag)
+    f.write(data)
+    f.write(struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+def render_to_png_banded(canvas, rect, filename, scale=1.0, band_height=BAND_HEIGHT):
+    """Renders the canvas area band by band, streaming each into a PNG file."""
+    size = rect.size().toSize() * scale
+    w, h = size.width(), size.height()
+    row_bytes = w * 3
+
+    with open(filename, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        _write_png_chunk(f, b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0))
+        # Same density QImage.save() writes: a new QImage's default dots per meter
+        density = QImage(1, 1, QImage.Format_RGB32)
+        _write_png_chunk(f, b"pHYs", struct.pack(">IIB", density.dotsPerMeterX(), density.dotsPerMeterY(), 1))
+        compressor = zlib.compressobj(6)
+
+        for y0 in range(0, h, band_height):
+            bh = min(band_height, h - y0)
+            band = QImage(w, bh, QImage.Format_RGB32)
+            band.fill(Qt.white)
+
+            painter = QPainter(band)
+            try:
+                painter.translate(0, -y0)
+                # Only components overlapping this band (plus a pixel for antialiasing)
+                visible = QRectF(rect.left(), rect.top() + y0 / scale,
+                                 rect.width(), bh / scale).adjusted(-1, -1, 1, 1)
+                _paint_content(painter, canvas, rect, scale, visible)
+            finally:
+                painter.end()
+
+            rgb = band.convertToFormat(QImage.Format_RGB888)
+            bits = rgb.constBits()
+            bits.setsize(rgb.sizeInBytes())
+            data = memoryview(bits)
+            stride = rgb.bytesPerLine()
+
+            # Filter type 0 (None) per scanline; stride may include padding
+            raw = b"".join(
+                b"\x00" + data[i * stride:i * stride + row_bytes]
+                for i in range(bh)
+            )
+            chunk = compressor.compress(raw)
+            if chunk:
+                _write_png_chunk(f, b"IDAT", chunk)
+
+        _write_png_chunk(f, b"IDAT", compressor.flush())
+        _write_png_chunk(f, b"IEND", b"")
+
 def draw_equipment_table(painter, canvas, page_rect, start_y):
     """Draws the equipment table on the painter."""
     row_height = 35
@@ -497,8 +578,14 @@ def export_to_image(canvas, filename):
         # 3. Export
         scale_factor = 3.0
         rect = get_content_rect(canvas)
-        image = render_to_image(canvas, rect, scale=scale_factor)
-        image.save(filename, quality=100)
+        out_size = rect.size().toSize() * scale_factor
+        pixels = out_size.width() * out_size.height()
+
+        if filename.lower().endswith(".png") and pixels > BANDED_EXPORT_MIN_PIXELS:
+            render_to_png_banded(canvas, rect, filename, scale=scale_factor)
+        else:
+            image = render_to_image(canvas, rect, scale=scale_factor)
+            image.save(filename, quality=100)
     finally:
         # 4. Restore Zoom
         if old_z != 1.0:
@@ -516,8 +603,6 @@ def export_to_pdf(canvas, filename):
         
     try:
         rect = get_content_rect(canvas)
-        scale_factor = 4.0
-        image = render_to_image(canvas, rect, scale=scale_factor)
         
         # PDF Setup with HighResolution mode
         printer = QPrinter(QPrinter.HighResolution)
@@ -526,8 +611,10 @@ def export_to_pdf(canvas, filename):
         
         # Calculate size in millimeters for proper scaling
         mm_per_inch = 25.4
-        # Use printer's resolution for accurate conversion
-        dpi = printer.resolution()
+        # Content is in logical screen pixels, so size the page at screen
+        # DPI; the printer's own 1200 DPI only sets the painter's precision
+        # and QPainter(printer) scales to it below.
+        dpi = LOGICAL_DPI
         
         s = rect.size()
         w_mm = (s.width() / dpi) * mm_per_inch
@@ -538,14 +625,12 @@ def export_to_pdf(canvas, filename):
         
         painter = QPainter(printer)
         try:
-            # Enable high-quality rendering
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            painter.setRenderHint(QPainter.HighQualityAntialiasing)
-            
-            # Draw the high-res image to fill the page
+            # Paint straight onto the printer so lines, text and SVGs stay
+            # vector in the PDF (no intermediate raster image).
             target_rect = painter.viewport()
-            painter.drawImage(target_rect, image)
+            scale = min(target_rect.width() / rect.width(),
+                        target_rect.height() / rect.height())
+            _paint_content(painter, canvas, rect, scale)
         finally:
             painter.end()
     finally:
@@ -595,6 +680,10 @@ def generate_report_pdf(canvas, filename):
 
 def export_to_excel(canvas, filename):
     """Exports the list of equipment to an Excel file with auto-width columns."""
+    # pandas is imported here rather than at module level: it costs ~0.3s and
+    # this module is loaded during app startup via the canvas commands.
+    import pandas as pd
+
     equipment_list = []
     
     # Logic similar to draw_equipment_table to extract data
@@ -800,7 +889,7 @@ def load_from_pfd(canvas, filename):
                 c.start_adjust = d.get("start_adjust", 0.0)
                 c.end_adjust = d.get("end_adjust", 0.0)
                 
-                c.update_path(canvas.components, canvas.connections)
+                c.update_path(canvas.components, canvas.connections, getattr(canvas, "segment_index", None))
                 canvas.connections.append(c)
                 
         canvas.update()
@@ -1,39 +1,71 @@
-from PyQt5.QtGui import QColor, QPen, QBrush
+from PyQt5.QtGui import QColor, QPen, QBrush, QPainter, QPixmap, QPainterPath, QPolygonF
 from PyQt5.QtCore import Qt
 
-def draw_grid(painter, width, height, theme="light"):
-    dot_color = QColor(90, 90, 90) if theme == "dark" else QColor(180, 180, 180)
-    painter.setPen(dot_color)
+from src.connection import style_packs
+
+GRID_SPACING = 30
+
+# Paint resources shared across repaints
+_HANDLE_BRUSH = QBrush(QColor("#2563eb"))
+_ACTIVE_PENS = {
+    "dark": QPen(Qt.white, 2, Qt.DashLine),
+    "light": QPen(Qt.black, 2, Qt.DashLine),
+}
 
-    grid_spacing = 30
-    for x in range(0, width, grid_spacing):
-        for y in range(0, height, grid_spacing):
-            painter.drawPoint(x, y)
+# One grid cell (a single dot in the top-left corner) per theme
+_tile_cache = {}
 
-def draw_connections(painter, connections, components, theme="light", zoom=1.0):
+def _grid_tile(theme):
+    tile = _tile_cache.get(theme)
+    if tile is None:
+        dot_color = QColor(90, 90, 90) if theme == "dark" else QColor(180, 180, 180)
+        tile = QPixmap(GRID_SPACING, GRID_SPACING)
+        tile.fill(Qt.transparent)
+        p = QPainter(tile)
+        p.setPen(dot_color)
+        p.drawPoint(0, 0)
+        p.end()
+        _tile_cache[theme] = tile
+    return tile
+
+def draw_grid(painter, width, height, theme="light"):
+    painter.drawTiledPixmap(0, 0, width, height, _grid_tile(theme))
+
+def draw_connections(painter, connections, components, theme="light", zoom=1.0, clip_rect=None):
     # Draw all finished connections
     # Note: conn.update_path() is NOT called here — it is called only when
     # endpoints actually change (drag, drop, connect), not on every repaint.
+    # clip_rect (logical coords) limits painting to connections that can be visible.
+    if clip_rect is not None:
+        # Pad by the arrow head / handle size, whose logical size grows as zoom shrinks
+        margin = 20.0 / max(0.1, zoom)
+        clip_rect = clip_rect.adjusted(-margin, -margin, margin, margin)
+
+    # Zoom-scaled pens and arrow sizes, looked up once for the whole pass
+    unselected_style, selected_style = style_packs(theme, zoom)
+
     for conn in connections:
+        if clip_rect is not None and not clip_rect.intersects(conn.bounds):
+            continue
+
         # Render Connection (Line + Arrow + Jumps)
-        conn.paint(painter, theme=theme, zoom=zoom)
+        conn.paint(painter, theme=theme, zoom=zoom,
+                   style=selected_style if conn.is_selected else unselected_style)
 
-        # Draw Edit Handles if selected
+        # Draw Edit Handles if selected (batched into one path / one fill)
         if conn.is_selected:
-            painter.setBrush(QColor("#2563eb"))
-            painter.setPen(Qt.NoPen)
+            handles = QPainterPath()
+            handles.setFillRule(Qt.WindingFill) # overlapping handles stay solid
             for pt in conn.path:
-                painter.drawEllipse(pt, 4, 4)
+                handles.addEllipse(pt, 4, 4)
+            painter.fillPath(handles, _HANDLE_BRUSH)
 
 def draw_active_connection(painter, active_connection, theme="light"):
     if active_connection:
-        color = Qt.white if theme == "dark" else Qt.black
-        painter.setPen(QPen(color, 2, Qt.DashLine))
+        painter.setPen(_ACTIVE_PENS["dark" if theme == "dark" else "light"])
         painter.setBrush(Qt.NoBrush)
         
         if not active_connection.painter_path.isEmpty():
             painter.drawPath(active_connection.painter_path)
         else:
-            path = active_connection.path
-            for i in range(len(path) - 1):
-                painter.drawLine(path[i], path[i + 1])
+            painter.drawPolyline(QPolygonF(active_connection.path))
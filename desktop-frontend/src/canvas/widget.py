@@ -5,7 +5,7 @@ from PyQt5.QtWidgets import QWidget, QLabel, QUndoStack
 from PyQt5.QtWidgets import QWidget, QLabel, QUndoStack, QVBoxLayout, QHBoxLayout, QPushButton, QFrame, QSizePolicy
 from PyQt5.QtGui import QPainter, QColor, QPalette
 
-from src.connection import Connection
+from src.connection import Connection, SegmentIndex, HitGrid
 from src.component_widget import ComponentWidget
 import src.app_state as app_state
 from src.canvas import resources, painter
@@ -36,6 +36,8 @@ class CanvasWidget(QWidget):
         self.components = []
         self.connections = []
         self.active_connection = None
+        self.segment_index = SegmentIndex() # Scene R-tree for jump detection on large diagrams
+        self.hit_grid = HitGrid() # Bucketed connection segments for click hit-testing
 
         # PROJECT TRACKING
         self.project_id = None
@@ -233,16 +235,8 @@ class CanvasWidget(QWidget):
             logical_pos = self.get_logical_pos(event.pos())
 
             # Connection hit test
-            hit_connection = None
-            hit_index = -1
-            for conn in self.connections:
-                # CONNECTION HIT TEST uses LOGICAL coordinates
-                # Ensure connection class is updated or we pass logical logic
-                idx = conn.hit_test(logical_pos)
-                if idx != -1:
-                    hit_connection = conn
-                    hit_index = idx
-                    break
+            # CONNECTION HIT TEST uses LOGICAL coordinates; the grid only visits segments near the click
+            hit_connection, hit_index = self.hit_grid.hit_test(logical_pos, self.connections)
 
             if hit_connection:
                 # Drag logic for connection
@@ -260,7 +254,7 @@ class CanvasWidget(QWidget):
                 for p in params:
                     old = getattr(hit_connection, p)
                     setattr(hit_connection, p, old + 1.0)
-                    hit_connection.update_path(self.components, self.connections)
+                    hit_connection.update_path(self.components, self.connections, self.segment_index)
                     new_points = hit_connection.path
                     
                     sens = QPointF(0, 0)
@@ -277,7 +271,7 @@ class CanvasWidget(QWidget):
                         best_sensitivity = sens
                 
                 hit_connection.path = list(base_points)
-                hit_connection.update_path(self.components, self.connections)
+                hit_connection.update_path(self.components, self.connections, self.segment_index)
 
                 self.drag_param_name = best_param
                 self.drag_sensitivity = best_sensitivity
@@ -324,7 +318,7 @@ class CanvasWidget(QWidget):
                 change = dot / sens_sq
                 new_val = self.drag_start_param_val + change
                 setattr(self.drag_connection, self.drag_param_name, new_val)
-                self.drag_connection.update_path(self.components, self.connections)
+                self.drag_connection.update_path(self.components, self.connections, self.segment_index)
                 self.update()
 
         super().mouseMoveEvent(event)
@@ -379,7 +373,7 @@ class CanvasWidget(QWidget):
             self.active_connection.clear_snap_target()
             self.active_connection.current_pos = pos 
 
-        self.active_connection.update_path(self.components, self.connections)
+        self.active_connection.update_path(self.components, self.connections, self.segment_index)
         self.update()
 
     def mouseReleaseEvent(self, event):
@@ -436,7 +430,7 @@ class CanvasWidget(QWidget):
                     self.active_connection.snap_grip_index,
                     self.active_connection.snap_side
                 )
-                self.active_connection.update_path(self.components, self.connections)
+                self.active_connection.update_path(self.components, self.connections, self.segment_index)
                 
                 # Use Undo Command
                 cmd = AddConnectionCommand(self, self.active_connection)
@@ -459,8 +453,13 @@ class CanvasWidget(QWidget):
         
         painter.draw_grid(qp, logical_w, logical_h, app_state.current_theme)
         
+        # Exposed area in LOGICAL coords, used to skip off-screen connections
+        r = event.rect()
+        z = self.zoom_level
+        logical_clip = QRectF(r.x() / z, r.y() / z, r.width() / z, r.height() / z)
+        
         # Draws connections in logical coords!
-        painter.draw_connections(qp, self.connections, self.components, theme=app_state.current_theme, zoom=self.zoom_level)
+        painter.draw_connections(qp, self.connections, self.components, theme=app_state.current_theme, zoom=self.zoom_level, clip_rect=logical_clip)
         painter.draw_active_connection(qp, self.active_connection, theme=app_state.current_theme)
 
     # ---------------------- COMPONENT CREATION ----------------------
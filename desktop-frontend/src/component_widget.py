@@ -394,9 +394,10 @@ class ComponentWidget(QWidget):
                 # Recalculate paths for connections attached to moved components
                 if hasattr(parent, "connections"):
                     moved = {c for c in parent.components if c.is_selected}
+                    segment_index = getattr(parent, "segment_index", None)
                     for conn in parent.connections:
                         if conn.start_component in moved or conn.end_component in moved:
-                            conn.update_path(parent.components, parent.connections)
+                            conn.update_path(parent.components, parent.connections, segment_index)
                         
                 # Force full repaint — prevents stale connection artefacts
                 parent.repaint()
@@ -1,6 +1,311 @@
-from PyQt5.QtCore import QPoint, QPointF, QRectF, Qt, QLineF, QSizeF
+from PyQt5.QtCore import QPoint, QPointF, QRectF, Qt
 from PyQt5.QtGui import QPainterPath, QColor, QPen, QBrush, QPolygonF
 import math
+import numpy as np
+
+from src.connection_kernels import compute_jumps, intersect_h_v
+
+try:
+    from rtree import index as rtree_index
+except ImportError:  # optional: jump detection falls back to a plain scan
+    rtree_index = None
+
+# Below this many connections a plain scan is cheaper than querying the R-tree
+RTREE_MIN_CONNECTIONS = 32
+
+# Radius of the semi-circle drawn where a connection jumps over another
+JUMP_RADIUS = 6.0
+
+# Cell size (logical px) of the HitGrid used for canvas click hit-testing
+HIT_GRID_CELL = 100.0
+
+# QPainterPath.clear()/reserve() arrived in Qt 5.13; older builds allocate a new path
+_PATH_REUSE = hasattr(QPainterPath, "clear") and hasattr(QPainterPath, "reserve")
+# Elements per jump: lineTo up to it, the arc's connecting lineTo and two cubic quarter-curves (3 each)
+_ELEMENTS_PER_JUMP = 8
+
+
+class SegmentIndex:
+    """
+    Scene-level R-tree over the raw orthogonal segments of every connection.
+    Entries are keyed by connection and refreshed lazily in sync(): only
+    connections whose _path_version changed since the last sync are re-inserted.
+    """
+    available = rtree_index is not None
+
+    def __init__(self):
+        self._index = None
+        self._entries = {} # id(conn) -> (conn, path_version, [(item_id, bbox), ...])
+        self._items = {} # item_id -> (conn, segment_index); rtree would pickle stored objects
+        self._next_id = 0
+
+    def sync(self, connections):
+        if self._index is None:
+            self._index = rtree_index.Index()
+
+        live = set()
+        for conn in connections:
+            key = id(conn)
+            live.add(key)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is conn and entry[1] == conn._path_version:
+                continue
+            if entry is not None:
+                self._remove(key)
+            self._insert(conn)
+
+        for key in [k for k in self._entries if k not in live]:
+            self._remove(key)
+
+    def candidates(self, envelope):
+        """Yields (connection, segment_index) for segments whose box meets envelope."""
+        items = self._items
+        for item_id in self._index.intersection(envelope):
+            yield items[item_id]
+
+    def _insert(self, conn):
+        items = []
+        for j, (x1, y1, x2, y2) in enumerate(conn._segment_array().tolist()):
+            bbox = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+            item_id = self._next_id
+            self._next_id += 1
+            self._index.insert(item_id, bbox)
+            self._items[item_id] = (conn, j)
+            items.append((item_id, bbox))
+        self._entries[id(conn)] = (conn, conn._path_version, items)
+
+    def _remove(self, key):
+        _, _, items = self._entries.pop(key)
+        for item_id, bbox in items:
+            self._index.delete(item_id, bbox)
+            del self._items[item_id]
+
+
+class HitGrid:
+    """
+    Scene-level uniform grid over connection segments for pointer hit-testing.
+    A query only looks at segments bucketed in the cells around the cursor instead
+    of hit-testing every connection. Buckets are refreshed lazily per connection
+    whenever its point array has been replaced.
+    """
+    def __init__(self, cell_size=HIT_GRID_CELL):
+        self.cell_size = cell_size
+        self._cells = {} # (cx, cy) -> {(id(conn), segment_index), ...}
+        self._entries = {} # id(conn) -> (conn, pts, [cells])
+
+    def sync(self, connections):
+        """Re-buckets changed connections; returns {id(conn): list position}."""
+        order = {}
+        for i, conn in enumerate(connections):
+            key = id(conn)
+            order[key] = i
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is conn and entry[1] is conn._pts:
+                continue
+            if entry is not None:
+                self._remove(key)
+            self._insert(conn)
+
+        for key in [k for k in self._entries if k not in order]:
+            self._remove(key)
+        return order
+
+    def hit_test(self, pos, connections, tolerance=5.0):
+        """
+        Same answer as calling conn.hit_test(pos) on each connection in order:
+        returns (first connection hit, its first segment hit) or (None, -1).
+        """
+        order = self.sync(connections)
+        px, py = pos.x(), pos.y()
+        size = self.cell_size
+        best = None # (list position, segment index)
+        for cx in range(math.floor((px - tolerance) / size), math.floor((px + tolerance) / size) + 1):
+            for cy in range(math.floor((py - tolerance) / size), math.floor((py + tolerance) / size) + 1):
+                for key, j in self._cells.get((cx, cy), ()):
+                    rank = (order[key], j)
+                    if best is not None and rank >= best:
+                        continue
+                    if self._entries[key][0].hit_test_segment(j, pos, tolerance):
+                        best = rank
+        if best is None:
+            return None, -1
+        return connections[best[0]], best[1]
+
+    def _insert(self, conn):
+        key = id(conn)
+        size = self.cell_size
+        cells = []
+        for j, (x1, y1, x2, y2) in enumerate(conn._segment_array().tolist()):
+            for cx in range(math.floor(min(x1, x2) / size), math.floor(max(x1, x2) / size) + 1):
+                for cy in range(math.floor(min(y1, y2) / size), math.floor(max(y1, y2) / size) + 1):
+                    self._cells.setdefault((cx, cy), set()).add((key, j))
+                    cells.append(((cx, cy), j))
+        self._entries[key] = (conn, conn._pts, cells)
+
+    def _remove(self, key):
+        _, _, cells = self._entries.pop(key)
+        for cell, j in cells:
+            bucket = self._cells[cell]
+            bucket.discard((key, j))
+            if not bucket:
+                del self._cells[cell]
+
+
+def _orthogonal_segment_arrays(connections):
+    """
+    Stack the raw segments of connections into two float arrays:
+    h_segs rows are (x_min, x_max, y) and v_segs rows are (x, y_min, y_max).
+    """
+    hs = []
+    vs = []
+    for conn in connections:
+        h, v = conn._orthogonal_segments()
+        hs.append(h)
+        vs.append(v)
+    if not hs:
+        return np.empty((0, 3)), np.empty((0, 3))
+    return np.concatenate(hs), np.concatenate(vs)
+
+
+# -----------------------------
+# Orthogonal routing: one handler per (start_side, target_side) pair.
+# Each returns the points between start and end; calculate_path adds those two.
+# sx/sy, ex/ey are the start/end coordinates and s_box/e_box the component
+# edges as (left, top, right, bottom), snapshotted once per calculate_path.
+# -----------------------------
+def _via_x(ns, pe, x):
+    return [ns, QPointF(x, ns.y()), QPointF(x, pe.y()), pe]
+
+def _via_y(ns, pe, y):
+    return [ns, QPointF(ns.x(), y), QPointF(pe.x(), y), pe]
+
+def _route_elbow_vertical(sx, sy, ex, ey, ns, pe, s_box, e_box, off_start, off_end, off_mid, path_offset):
+    # Horizontal stub, then straight down/up into a top/bottom grip
+    return [ns, QPointF(ns.x(), pe.y()), pe]
+
+def _route_elbow_horizontal(sx, sy, ex, ey, ns, pe, s_box, e_box, off_start, off_end, off_mid, path_offset):
+    # Vertical stub, then straight across into a left/right grip
+    return [ns, QPointF(pe.x(), ns.y()), pe]
+
+def _route_right_left(sx, sy, ex, ey, ns, pe, s_box, e_box, off_start, off_end, off_mid, path_offset):
+    # Standard Horizontal Connection
+    if sx + off_start < ex - off_end:
+        mid_x = (sx + ex) / 2 + path_offset
+        return [QPointF(mid_x, sy), QPointF(mid_x, ey)]
+    # Overlap or simple Z: route below the lowest component
+    return _via_y(ns, pe, max(s_box[3], e_box[3]) + off_mid)
+
+def _route_right_right(sx, sy, ex, ey, ns, pe, s_box, e_box, off_start, off_end, off_mid, path_offset):
+    # U-turn: route to the right of the right-most component
+    return _via_x(ns, pe, max(s_box[2], e_box[2]) + off_mid)
+
+def _route_left_right(sx, sy, ex, ey, ns, pe, s_box, e_box, off_start, off_end, off_mid, path_offset):
+    if sx - off_start > ex + off_end:
+        mid_x = (sx + ex) / 2 + path_offset
+        return [QPointF(mid_x, sy), QPointF(mid_x, ey)]
+    # Overlap: route below
+    return _via_y(ns, pe, max(s_box[3], e_box[3]) + off_mid)
+
+def _route_left_left(sx, sy, ex, ey, ns, pe, s_box, e_box, off_start, off_end, off_mid, path_offset):
+    # U-turn: route to the left of the left-most component
+    return _via_x(ns, pe, min(s_box[0], e_box[0]) - off_mid)
+
+def _route_top_bottom(sx, sy, ex, ey, ns, pe, s_box, e_box, off_start, off_end, off_mid, path_offset):
+    if sy - off_start > ey + off_end:
+        mid_y = (sy + ey) / 2 + path_offset
+        return [QPointF(sx, mid_y), QPointF(ex, mid_y)]
+    # Overlap -> Route Right
+    return _via_x(ns, pe, max(s_box[2], e_box[2]) + off_mid)
+
+def _route_top_top(sx, sy, ex, ey, ns, pe, s_box, e_box, off_start, off_end, off_mid, path_offset):
+    # U-turn: route above
+    return _via_y(ns, pe, min(s_box[1], e_box[1]) - off_mid)
+
+def _route_bottom_top(sx, sy, ex, ey, ns, pe, s_box, e_box, off_start, off_end, off_mid, path_offset):
+    if sy + off_start < ey - off_end:
+        mid_y = (sy + ey) / 2 + path_offset
+        return [QPointF(sx, mid_y), QPointF(ex, mid_y)]
+    # Overlap -> Route Right
+    return _via_x(ns, pe, max(s_box[2], e_box[2]) + off_mid)
+
+def _route_bottom_bottom(sx, sy, ex, ey, ns, pe, s_box, e_box, off_start, off_end, off_mid, path_offset):
+    # U-turn: route below
+    return _via_y(ns, pe, max(s_box[3], e_box[3]) + off_mid)
+
+ROUTE_TABLE = {
+    ("right", "left"): _route_right_left,
+    ("right", "top"): _route_elbow_vertical,
+    ("right", "bottom"): _route_elbow_vertical,
+    ("right", "right"): _route_right_right,
+    ("left", "right"): _route_left_right,
+    ("left", "top"): _route_elbow_vertical,
+    ("left", "bottom"): _route_elbow_vertical,
+    ("left", "left"): _route_left_left,
+    ("top", "bottom"): _route_top_bottom,
+    ("top", "left"): _route_elbow_horizontal,
+    ("top", "right"): _route_elbow_horizontal,
+    ("top", "top"): _route_top_top,
+    ("bottom", "top"): _route_bottom_top,
+    ("bottom", "left"): _route_elbow_horizontal,
+    ("bottom", "right"): _route_elbow_horizontal,
+    ("bottom", "bottom"): _route_bottom_bottom,
+}
+
+# Any other target side from a known start side takes that side's U-turn
+_U_TURN_ROUTES = {
+    "right": _route_right_right,
+    "left": _route_left_left,
+    "top": _route_top_top,
+    "bottom": _route_bottom_bottom,
+}
+
+
+# Shared empty point array for connections that have not been routed yet
+_NO_POINTS = np.empty((0, 2))
+
+
+# -----------------------------
+# Style packs: paint() constants that depend only on theme and zoom
+# -----------------------------
+_style_packs = {}
+_STYLE_PACK_LIMIT = 64 # Distinct (theme, zoom) pairs kept before the cache is reset
+
+def _build_style_pack(theme, zoom, selected):
+    # Determine visual width based on selection
+    visual_width = 4.0 if selected else 2.5
+    # LOGICAL sizes maintain a constant VISUAL size at this zoom
+    scale = max(0.1, zoom)
+
+    if selected:
+        color = QColor("#2563eb")
+    else:
+        color = Qt.white if theme == "dark" else Qt.black
+
+    # Eraser Line hides the arrow "nose"; slightly thicker than the line to fully cover it
+    eraser_color = QColor("#0f172a") if theme == "dark" else Qt.white
+
+    return {
+        "pen": QPen(color, visual_width / scale),
+        # Arrow tip clears the component plate (~6px) in Dark Mode, the grip (~4px) in Light Mode
+        "retract": (10.0 if theme == "dark" else 4.0) / scale,
+        "arrow_size": 15.0 / scale,
+        "eraser_pen": QPen(eraser_color, (visual_width + 1.0) / scale),
+        # Solid Black border ensures visibility on top of EVERYTHING.
+        "border_pen": QPen(Qt.black, 1.5 / scale),
+        "brush": QBrush(color),
+    }
+
+def style_packs(theme, zoom):
+    """(unselected, selected) style packs for a theme and zoom, built once and shared by every connection."""
+    key = (theme, zoom)
+    packs = _style_packs.get(key)
+    if packs is None:
+        if len(_style_packs) >= _STYLE_PACK_LIMIT:
+            _style_packs.clear()
+        packs = (_build_style_pack(theme, zoom, False), _build_style_pack(theme, zoom, True))
+        _style_packs[key] = packs
+    return packs
+
 
 class Connection:
     def __init__(self, start_component, start_grip_index, start_side):
@@ -18,7 +323,9 @@ class Connection:
         self.snap_side = None
 
         self.current_pos = QPoint(0, 0) # Used during dragging
-        self.path = [] # List of QPointF (Raw Orthogonal Points)
+        # Raw Orthogonal Points: stored as an (N, 2) float array, exposed as QPointFs via .path
+        self._pts = _NO_POINTS
+        self._path_points = []
         self.painter_path = QPainterPath() # Final Path with Jumps
 
         
@@ -28,20 +335,54 @@ class Connection:
         self.start_adjust = 0.0 # Moves the start stub (ns)
         self.end_adjust = 0.0 # Moves the end stub (pe)
 
+        # Change tracking: update_path() is skipped when nothing it reads has changed
+        self._path_signature = None
+        self._path_version = 0 # Bumped whenever path/painter_path are regenerated
+        self._bounds = None
+        self._segment_cache = None # (pts, h_segs, v_segs)
+        self._segs_cache = None # (pts, (n, 4) segment array)
+        self._hit_cache = None # (pts, per-segment hit_test arrays)
+        self._paint_cache = None # Pens/arrow geometry from the last paint() (see _build_paint_cache)
+        self._path_cache_key = None # Geometry that produced _path_cache_value
+        self._path_cache_value = None # (pts, points, bbox)
+        self._bbox = None # (min_x, min_y, max_x, max_y) of path, inflated by JUMP_RADIUS
+        self._jump_scratch = np.empty(256, dtype=np.float64) # Per-segment crossing distances (segment-index pass)
+        self._jump_memo = ([], []) # (segment rows, their jump distances) from the last jump pass
+        self._jump_memo_key = None
+
+    @property
+    def path(self):
+        """Raw orthogonal points as a list of QPointF, built on demand from the float array."""
+        if self._path_points is None:
+            self._path_points = [QPointF(x, y) for x, y in self._pts.tolist()]
+        return self._path_points
+
+    @path.setter
+    def path(self, points):
+        self._set_points(np.array([(p.x(), p.y()) for p in points], dtype=np.float64).reshape(-1, 2))
+
+    def _set_points(self, pts, points=None):
+        # The array is replaced, never mutated, so its identity keys every derived cache
+        self._pts = pts
+        self._path_points = points
+
     def set_end_grip(self, component, grip_index, side):
         self.end_component = component
         self.end_grip_index = grip_index
         self.end_side = side
+        self._path_cache_key = None
 
     def set_snap_target(self, component, grip_index, side):
         self.snap_component = component
         self.snap_grip_index = grip_index
         self.snap_side = side
+        self._path_cache_key = None
 
     def clear_snap_target(self):
         self.snap_component = None
         self.snap_grip_index = None
         self.snap_side = None
+        self._path_cache_key = None
 
     def get_start_pos(self):
         # canvas-relative coordinate (LOGICAL)
@@ -61,42 +402,114 @@ class Connection:
             
         return self.current_pos
         
+    @property
+    def bounds(self):
+        """Logical bounding rect of the routed path (jumps included), cached per path update.
+        Padded by 1px so straight runs never yield a zero-area rect (which QRectF.intersects rejects).
+        """
+        if self._bounds is None:
+            if not self.painter_path.isEmpty():
+                rect = self.painter_path.boundingRect()
+            elif len(self._pts):
+                (min_x, min_y), (max_x, max_y) = self._pts.min(axis=0), self._pts.max(axis=0)
+                rect = QRectF(min_x, min_y, max_x - min_x, max_y - min_y)
+            else:
+                return QRectF()
+            self._bounds = rect.adjusted(-1, -1, 1, 1)
+        return self._bounds
+
+    def _orthogonal_segments(self):
+        """This path's segments split by orientation (see _orthogonal_segment_arrays), cached per point array."""
+        cache = self._segment_cache
+        if cache is not None and cache[0] is self._pts:
+            return cache[1], cache[2]
+
+        x1, y1, x2, y2 = self._segment_array().T
+        vert = np.abs(x1 - x2) < 1.0 # Vertical segment
+        horiz = ~vert
+        vert &= y1 != y2 # Zero-length segments never cross anything
+        h_segs = np.column_stack((np.minimum(x1, x2)[horiz], np.maximum(x1, x2)[horiz], y1[horiz]))
+        v_segs = np.column_stack((x1[vert], np.minimum(y1, y2)[vert], np.maximum(y1, y2)[vert]))
+        self._segment_cache = (self._pts, h_segs, v_segs)
+        return h_segs, v_segs
+
+    def _segment_array(self):
+        """The path as (n, 4) float64 rows (x1, y1, x2, y2)."""
+        cache = self._segs_cache
+        if cache is not None and cache[0] is self._pts:
+            return cache[1]
+        pts = self._pts
+        segs = np.hstack((pts[:-1], pts[1:]))
+        self._segs_cache = (pts, segs)
+        return segs
+
+    def _hit_arrays(self):
+        """Per-segment orientation/extents for hit_test, plus the whole path's extent."""
+        cache = self._hit_cache
+        if cache is not None and cache[0] is self._pts:
+            return cache[1]
+        x1, y1, x2, y2 = self._segment_array().T
+        lo_x, hi_x = np.minimum(x1, x2), np.maximum(x1, x2)
+        lo_y, hi_y = np.minimum(y1, y2), np.maximum(y1, y2)
+        extent = (lo_x.min(), hi_x.max(), lo_y.min(), hi_y.max())
+        arrays = (np.abs(x1 - x2) < 1.0, x1, y1, lo_x, hi_x, lo_y, hi_y, extent)
+        self._hit_cache = (self._pts, arrays)
+        return arrays
+
     def hit_test(self, pos: QPoint, tolerance=5.0):
         """Checks if the position is near the connection path.
         Returns the index of the first segment hit, or -1 if none.
         """
-        if len(self.path) < 2:
+        if len(self._pts) < 2:
             return -1
-            
-        for i in range(len(self.path) - 1):
-            p1 = self.path[i]
-            p2 = self.path[i+1]
-            
-            # Distance from point to line segment
-            # Simplified for orthogonal lines
-            if abs(p1.x() - p2.x()) < 1.0: # Vertical segment
-                min_y = min(p1.y(), p2.y())
-                max_y = max(p1.y(), p2.y())
-                if min_y - tolerance <= pos.y() <= max_y + tolerance:
-                    if abs(pos.x() - p1.x()) <= tolerance:
-                        return i
-            else: # Horizontal segment
-                min_x = min(p1.x(), p2.x())
-                max_x = max(p1.x(), p2.x())
-                if min_x - tolerance <= pos.x() <= max_x + tolerance:
-                    if abs(pos.y() - p1.y()) <= tolerance:
-                        return i
-        return -1
+
+        is_vert, x1, y1, lo_x, hi_x, lo_y, hi_y, extent = self._hit_arrays()
+        px, py = pos.x(), pos.y()
+
+        # Most connections are nowhere near the cursor: reject on the path extent first
+        if (px < extent[0] - tolerance or px > extent[1] + tolerance
+                or py < extent[2] - tolerance or py > extent[3] + tolerance):
+            return -1
+
+        # Distance from point to line segment
+        # Simplified for orthogonal lines: vertical rows test y-span/x-offset, horizontal the reverse
+        hit = np.where(
+            is_vert,
+            (lo_y - tolerance <= py) & (py <= hi_y + tolerance) & (np.abs(px - x1) <= tolerance),
+            (lo_x - tolerance <= px) & (px <= hi_x + tolerance) & (np.abs(py - y1) <= tolerance),
+        )
+        return int(np.argmax(hit)) if hit.any() else -1
+
+    def hit_test_segment(self, i, pos, tolerance=5.0):
+        """hit_test() for segment i alone (used by HitGrid for bucketed candidates)."""
+        is_vert, x1, y1, lo_x, hi_x, lo_y, hi_y, _ = self._hit_arrays()
+        px, py = pos.x(), pos.y()
+        if is_vert[i]:
+            return bool(lo_y[i] - tolerance <= py <= hi_y[i] + tolerance and abs(px - x1[i]) <= tolerance)
+        return bool(lo_x[i] - tolerance <= px <= hi_x[i] + tolerance and abs(py - y1[i]) <= tolerance)
 
     def calculate_path(self, obstacles=None):
         """
         Ports the Rule-Based Orthogonal Routing logic from the reference project.
         Determines the path points based on start/end positions and grip directions.
+        The route is memoized on its geometry and reused while none of it moves.
         """
-        self.path = [] # Reset
-        start_point = QPointF(self.get_start_pos())
+        self._paint_cache = None
+        # Resolve both grips once; the memo key and the routing share them
+        start_pos = self.get_start_pos()
+        end_pos = self.get_end_pos()
+        key = self._geometry_key(start_pos, end_pos)
+        if key == self._path_cache_key and self._path_cache_value is not None:
+            pts, points, self._bbox = self._path_cache_value
+            self._set_points(pts, points)
+            return
+
+        self._set_points(_NO_POINTS, []) # Reset
+        start_point = QPointF(start_pos)
         points = [start_point]
-        end_point = QPointF(self.get_end_pos())
+        end_point = QPointF(end_pos)
+        sx, sy = start_point.x(), start_point.y()
+        ex, ey = end_point.x(), end_point.y()
         
         # OFFSETS
         # Base offset (20) + User Adjustments
@@ -104,28 +517,29 @@ class Connection:
         off_start = max(10.0, 30.0 + self.start_adjust)
         off_end = max(10.0, 20.0 + self.end_adjust)
         
-        # Component Bounds (for smart avoidance - use LOGICAL RECT)
+        # Component Bounds (for smart avoidance - use LOGICAL RECT), as (left, top, right, bottom)
         sitem = self.start_component.logical_rect
-        if self.end_component:
-            eitem = self.end_component.logical_rect
-        elif self.snap_component:
-            eitem = self.snap_component.logical_rect
+        s_box = (sitem.left(), sitem.top(), sitem.right(), sitem.bottom())
+        end_item = self.end_component or self.snap_component
+        if end_item:
+            eitem = end_item.logical_rect
+            e_box = (eitem.left(), eitem.top(), eitem.right(), eitem.bottom())
         else:
-            # Fake a small rect around the end point
-            eitem = QRectF(end_point.x()-10, end_point.y()-10, 20, 20)
+            # Fake a small 20x20 rect around the end point
+            e_box = (ex - 10, ey - 10, ex - 10 + 20, ey - 10 + 20)
 
         # 1. Determine "Next to Start" (ns)
         ns = QPointF()
         if self.start_side == "top":
-            ns = QPointF(start_point.x(), start_point.y() - off_start)
+            ns = QPointF(sx, sy - off_start)
         elif self.start_side == "bottom":
-            ns = QPointF(start_point.x(), start_point.y() + off_start)
+            ns = QPointF(sx, sy + off_start)
         elif self.start_side == "left":
-            ns = QPointF(start_point.x() - off_start, start_point.y())
+            ns = QPointF(sx - off_start, sy)
         elif self.start_side == "right":
-            ns = QPointF(start_point.x() + off_start, start_point.y())
+            ns = QPointF(sx + off_start, sy)
         else: # Fallback
-            ns = QPointF(start_point.x() + off_start, start_point.y())
+            ns = QPointF(sx + off_start, sy)
 
         # 2. Determine "Previous to End" (pe)
         pe = QPointF()
@@ -138,15 +552,15 @@ class Connection:
             target_side = self._guess_approach_side(start_point, end_point)
         
         if target_side == "top":
-            pe = QPointF(end_point.x(), end_point.y() - off_end)
+            pe = QPointF(ex, ey - off_end)
         elif target_side == "bottom":
-            pe = QPointF(end_point.x(), end_point.y() + off_end)
+            pe = QPointF(ex, ey + off_end)
         elif target_side == "left":
-            pe = QPointF(end_point.x() - off_end, end_point.y())
+            pe = QPointF(ex - off_end, ey)
         elif target_side == "right":
-            pe = QPointF(end_point.x() + off_end, end_point.y())
+            pe = QPointF(ex + off_end, ey)
         else:
-             pe = QPointF(end_point.x() - off_end, end_point.y())
+             pe = QPointF(ex - off_end, ey)
 
         # 3. Intermediate Points Logic (The "Brain")
         # Reuse 'self.path_offset' for the MIDDLE sections
@@ -154,139 +568,23 @@ class Connection:
         off_mid = 20.0 + self.path_offset 
         effective_end_offset = off_end 
 
-        # Case A: Start Right
-        if self.start_side == "right":
-            if target_side == "left":
-                # Standard Horizontal Connection
-                if start_point.x() + off_start < end_point.x() - effective_end_offset:
-                     mid_x = (start_point.x() + end_point.x()) / 2 + self.path_offset
-                     points.append(QPointF(mid_x, start_point.y()))
-                     points.append(QPointF(mid_x, end_point.y()))
-                else: 
-                     # Overlap or simple Z
-                     # Route below the lowest component
-                     y = max(sitem.bottom(), eitem.bottom()) + off_mid
-                     
-                     points.append(ns)
-                     points.append(QPointF(ns.x(), y)) 
-                     points.append(QPointF(pe.x(), y))
-                     points.append(pe)
-            
-            elif target_side == "top":
-                 points.append(ns)
-                 points.append(QPointF(ns.x(), pe.y()))
-                 points.append(pe)
-            
-            elif target_side == "bottom":
-                 points.append(ns)
-                 points.append(QPointF(ns.x(), pe.y()))
-                 points.append(pe)
-                 
-            else: # right -> right (U-turn)
-                 # Route to the right of the right-most component
-                 x = max(sitem.right(), eitem.right()) + off_mid
-                 points.append(ns)
-                 points.append(QPointF(x, ns.y()))
-                 points.append(QPointF(x, pe.y()))
-                 points.append(pe)
-
-        # Case B: Start Left
-        elif self.start_side == "left":
-            if target_side == "right":
-                 if start_point.x() - off_start > end_point.x() + effective_end_offset:
-                     mid_x = (start_point.x() + end_point.x()) / 2 + self.path_offset
-                     points.append(QPointF(mid_x, start_point.y()))
-                     points.append(QPointF(mid_x, end_point.y()))
-                 else:
-                     # Overlap
-                     # Route below
-                     y = max(sitem.bottom(), eitem.bottom()) + off_mid
-                     
-                     points.append(ns)
-                     points.append(QPointF(ns.x(), y))
-                     points.append(QPointF(pe.x(), y))
-                     points.append(pe)
-            
-            elif target_side == "top":
-                 points.append(ns)
-                 points.append(QPointF(ns.x(), pe.y()))
-                 points.append(pe)
-                 
-            elif target_side == "bottom":
-                 points.append(ns)
-                 points.append(QPointF(ns.x(), pe.y())) 
-                 points.append(pe)
-            
-            else: # left -> left
-                 # Route to the left of the left-most component
-                 x = min(sitem.left(), eitem.left()) - off_mid
-                 points.append(ns)
-                 points.append(QPointF(x, ns.y()))
-                 points.append(QPointF(x, pe.y()))
-                 points.append(pe)
-
-        # Case C: Start Top
-        elif self.start_side == "top":
-            if target_side == "bottom":
-                if start_point.y() - off_start > end_point.y() + effective_end_offset:
-                    mid_y = (start_point.y() + end_point.y()) / 2 + self.path_offset
-                    points.append(QPointF(start_point.x(), mid_y))
-                    points.append(QPointF(end_point.x(), mid_y))
-                else: 
-                     # Overlap -> Route Right
-                     x = max(sitem.right(), eitem.right()) + off_mid
-                     points.append(ns)
-                     points.append(QPointF(x, ns.y()))
-                     points.append(QPointF(x, pe.y()))
-                     points.append(pe)
-            elif target_side == "left":
-                 points.append(ns)
-                 points.append(QPointF(pe.x(), ns.y()))
-                 points.append(pe)
-            elif target_side == "right":
-                 points.append(ns)
-                 points.append(QPointF(pe.x(), ns.y()))
-                 points.append(pe)
-            else: # top -> top
-                 # Route above
-                 y = min(sitem.top(), eitem.top()) - off_mid
-                 points.append(ns)
-                 points.append(QPointF(ns.x(), y))
-                 points.append(QPointF(pe.x(), y))
-                 points.append(pe)
-
-        # Case D: Start Bottom
-        elif self.start_side == "bottom":
-             if target_side == "top":
-                 if start_point.y() + off_start < end_point.y() - effective_end_offset:
-                     mid_y = (start_point.y() + end_point.y()) / 2 + self.path_offset
-                     points.append(QPointF(start_point.x(), mid_y))
-                     points.append(QPointF(end_point.x(), mid_y))
-                 else:
-                     # Overlap -> Route Right
-                     x = max(sitem.right(), eitem.right()) + off_mid
-                     points.append(ns)
-                     points.append(QPointF(x, ns.y()))
-                     points.append(QPointF(x, pe.y()))
-                     points.append(pe)
-             elif target_side == "left":
-                 points.append(ns)
-                 points.append(QPointF(pe.x(), ns.y()))
-                 points.append(pe)
-             elif target_side == "right":
-                 points.append(ns)
-                 points.append(QPointF(pe.x(), ns.y()))
-                 points.append(pe)
-             else: # bottom -> bottom
-                 # Route below
-                 y = max(sitem.bottom(), eitem.bottom()) + off_mid
-                 points.append(ns)
-                 points.append(QPointF(ns.x(), y))
-                 points.append(QPointF(pe.x(), y))
-                 points.append(pe)
+        # One dict lookup picks the case; an unknown start side has no handler (straight line)
+        route = ROUTE_TABLE.get((self.start_side, target_side)) or _U_TURN_ROUTES.get(self.start_side)
+        if route is not None:
+            points.extend(route(sx, sy, ex, ey, ns, pe, s_box, e_box,
+                                off_start, effective_end_offset, off_mid, self.path_offset))
 
         points.append(end_point)
-        self.path = points
+        pts = np.array([(p.x(), p.y()) for p in points], dtype=np.float64)
+        self._set_points(pts, points)
+
+        # Envelope for the jump pass prefilter
+        (min_x, min_y), (max_x, max_y) = pts.min(axis=0).tolist(), pts.max(axis=0).tolist()
+        r = JUMP_RADIUS
+        self._bbox = (min_x - r, min_y - r, max_x + r, max_y + r)
+
+        self._path_cache_key = key
+        self._path_cache_value = (pts, points, self._bbox)
 
 
 
@@ -300,94 +598,149 @@ class Connection:
         else:
             return "top" if dy > 0 else "bottom"
 
-    def update_path(self, components, other_connections):
+    def _geometry_key(self, start=None, end=None):
+        """Hashable snapshot of every input that calculate_path() depends on."""
+        if start is None:
+            start = self.get_start_pos()
+        if end is None:
+            end = self.get_end_pos()
+        end_item = self.end_component or self.snap_component
+        return (
+            start.x(), start.y(), end.x(), end.y(),
+            self.start_side, self.end_side, self.snap_side,
+            self.path_offset, self.start_adjust, self.end_adjust,
+            self.start_component.logical_rect.getRect(),
+            end_item.logical_rect.getRect() if end_item else None,
+        )
+
+    def _compute_signature(self, other_connections):
+        """Hashable snapshot of every input that update_path() depends on."""
+        return (
+            self._geometry_key(),
+            tuple((id(o), o._path_version) for o in other_connections if o is not self),
+        )
+
+    def update_path(self, components, other_connections, segment_index=None):
         """
         High-level update:
         1. Calculate Orthogonal Path (points)
         2. Generate visual path with Jumps (QPainterPath)
+        Skipped entirely when neither this connection's geometry nor the
+        paths it may jump over have changed since the last call.
+        segment_index: optional scene SegmentIndex used to find crossings on large diagrams.
         """
-        self.calculate_path(components)
-        self._generate_jump_path(other_connections)
+        sig = self._compute_signature(other_connections)
+        if sig == self._path_signature and len(self._pts):
+            return
 
-    def _generate_jump_path(self, other_connections):
+        old_pts = self._pts
+        self.calculate_path(components)
+        self._generate_jump_path(other_connections, segment_index, sig[1])
+        self._path_signature = sig
+        if self._pts is not old_pts:
+            # Only a re-route invalidates the jumps of connections crossing this one
+            self._path_version += 1
+        self._bounds = None
+
+    def _generate_jump_path(self, other_connections, segment_index=None, others_key=None):
         """
         Converts self.path (points) into self.painter_path (QPainterPath)
         with semi-circle jumps over intersecting connections.
+        others_key: the other paths' versions (see _compute_signature); while it is
+        unchanged, segments that did not move reuse their jumps from the last call.
         """
-        self.painter_path = QPainterPath()
-        if not self.path:
+        if _PATH_REUSE:
+            self.painter_path.clear() # Keeps the element buffer instead of reallocating it
+        else:
+            self.painter_path = QPainterPath()
+        self._paint_cache = None
+        if not len(self._pts):
             return
 
-        self.painter_path.moveTo(self.path[0])
-        
-        # radius of the jump
-        r = 6.0 
+        # Nothing to jump over (single wire, or only this one): plain polyline, no ordering work
+        if not other_connections or (len(other_connections) == 1 and other_connections[0] is self):
+            self._straight_painter_path()
+            return
 
-        for i in range(len(self.path) - 1):
-            p1 = self.path[i]
-            p2 = self.path[i+1]
-            vec = p2 - p1
-            length = math.sqrt(vec.x()**2 + vec.y()**2)
-            if length < 0.1: continue
-            
-            # Unit direction
-            u = vec / length
+        # Order-Based Jump Logic:
+        # If I am older (lower index) than the other connection, I go straight (don't detect intersection).
+        # Indices are looked up once here instead of list.index() per segment pair.
+        order = {id(c): i for i, c in enumerate(other_connections)}
+        my_index = order.get(id(self)) # None: not in the scene yet, jumps over everything
+
+        # Crossings along a segment depend only on its end points and the paths it may jump,
+        # so after a slider nudge only the segments that actually moved are tested again
+        segs = self._segment_array()
+        rows = segs.tolist()
+        seg_jumps = [None] * len(rows)
+        missing = range(len(rows))
+        if others_key is not None and others_key == self._jump_memo_key:
+            memo = {tuple(row): dists for row, dists in zip(*self._jump_memo)}
+            missing = []
+            for i, row in enumerate(rows):
+                dists = memo.get(tuple(row))
+                if dists is None:
+                    missing.append(i)
+                else:
+                    seg_jumps[i] = dists
 
+        # radius of the jump
+        r = JUMP_RADIUS
+
+        # Large diagrams: only test segments whose boxes overlap (R-tree)
+        use_index = (segment_index is not None and SegmentIndex.available
+                     and len(other_connections) >= RTREE_MIN_CONNECTIONS)
+        if missing and use_index:
+            segment_index.sync(other_connections)
+            for i in missing:
+                seg_jumps[i] = self._indexed_crossings(rows[i], segment_index, order, my_index, r)
+        elif missing:
+            # Only connections whose envelope meets ours can cross it
+            min_x, min_y, max_x, max_y = self._bbox
+            crossable = []
+            for o in other_connections:
+                if o is self or not len(o._pts) or (my_index is not None and order[id(o)] > my_index):
+                    continue
+                ob = o._bbox
+                if ob is not None and (ob[0] > max_x or ob[2] < min_x or ob[1] > max_y or ob[3] < min_y):
+                    continue
+                crossable.append(o)
+            if crossable:
+                # Numeric pass for every missing segment at once; only drawing stays in Python below
+                h_segs, v_segs = _orthogonal_segment_arrays(crossable)
+                subset = segs if len(missing) == len(rows) else segs[missing]
+                jump_dists, jump_offsets = compute_jumps(subset, h_segs, v_segs, r)
+                jump_dists, jump_offsets = jump_dists.tolist(), jump_offsets.tolist()
+                for k, i in enumerate(missing):
+                    seg_jumps[i] = jump_dists[jump_offsets[k]:jump_offsets[k + 1]]
+            else:
+                for i in missing:
+                    seg_jumps[i] = []
+
+        self._jump_memo = (rows, seg_jumps)
+        self._jump_memo_key = others_key
+
+        if not any(seg_jumps):
+            self._straight_painter_path()
+            return
 
+        self.painter_path.moveTo(*self._pts[0].tolist())
+        if _PATH_REUSE:
+            # moveTo + a lineTo per segment + the jumps, all known up front
+            self.painter_path.reserve(1 + len(segs) + _ELEMENTS_PER_JUMP * sum(map(len, seg_jumps)))
 
-            # Identify intersections
-            # We collect (distance_from_p1, intersection_point)
-            intersections = []
-            
-            current_seg = QLineF(p1, p2)
-            
-            for other in other_connections:
-                if other == self: continue
-
-                # Order-Based Jump Logic:
-                # If I am older (lower index) than the other connection, I go straight (don't detect intersection).
-                if self in other_connections:
-                     my_index = other_connections.index(self)
-                     # other is guaranteed to be in other_connections because we are iterating it
-                     other_index = other_connections.index(other) # No try/except needed hopefully
-                     
-                     if my_index < other_index:
-                         continue
-                # iterate other's segments
-                # We use raw points from other.path to be robust
-                if not other.path: continue
-                for j in range(len(other.path) - 1):
-                    op1 = other.path[j]
-                    op2 = other.path[j+1]
-                    other_seg = QLineF(op1, op2)
-                    
-                    # Intersect?
-                    intersection_point = QPointF()
-                    type_ = current_seg.intersect(other_seg, intersection_point)
-                    
-                    if type_ == QLineF.BoundedIntersection:
-                        # Check if it's a real crossing, not just touching endpoints
-                        # and not collinear overlaps
-                        dist = math.sqrt((intersection_point.x() - p1.x())**2 + (intersection_point.y() - p1.y())**2)
-                        
-                        # Filter out hits too close to start/end of segment (corners)
-                        if r < dist < (length - r):
-                            intersections.append(dist)
-
-            intersections.sort()
+        for (p1x, p1y, p2x, p2y), clean_intersections in zip(rows, seg_jumps):
+            dx, dy = p2x - p1x, p2y - p1y
+            length = math.hypot(dx, dy)
+            if length < 0.1: continue
             
+            # Unit direction (per-segment constants, shared by every crossing/jump on this segment)
+            ux, uy = dx / length, dy / length
+            angle = math.degrees(math.atan2(uy, ux))
+            start_angle = -angle + 180
+
             # Build segment with jumps
             current_dist = 0.0
-            
-            # De-duplicate close intersections (overlapping lines)
-            clean_intersections = []
-            if intersections:
-                last_d = intersections[0]
-                clean_intersections.append(last_d)
-                for d in intersections[1:]:
-                    if d - last_d > 2.2 * r: # Ensure space for jump
-                        clean_intersections.append(d)
-                        last_d = d
 
             for dist in clean_intersections:
                 # Draw line to jump start
@@ -395,15 +748,15 @@ class Connection:
                 segment_end_dist = dist - r
                 
                 if segment_end_dist > current_dist:
-                    dest = p1 + u * segment_end_dist
-                    self.painter_path.lineTo(dest)
+                    self.painter_path.lineTo(p1x + ux * segment_end_dist, p1y + uy * segment_end_dist)
                 
                 # Draw Jump (Arc)
                 # We want a semi-circle. 
                 # QPainterPath.arcTo(rect, startAngle, sweepLength)
                 # Rect is bounding box of the circle.
                 # Center of jump is p1 + u * dist
-                jump_center = p1 + u * dist
+                cx = p1x + ux * dist
+                cy = p1y + uy * dist
                 
                 # Determine rect
                 # This arc should bulge "up" relative to the line direction?
@@ -412,11 +765,9 @@ class Connection:
                 # Let's say we bump "Positive Normal"
                 # Normal (-y, x)
                 
-                rect_top_left = jump_center - QPointF(r, r)
-                rect = QRectF(rect_top_left, QSizeF(2*r, 2*r))
+                rect = QRectF(cx - r, cy - r, 2*r, 2*r)
                 
-                # Calculate angle of the line
-                angle = math.degrees(math.atan2(u.y(), u.x()))
+                # Angle of the line is computed once per segment (see above)
                 # arcTo takes start angle (3 o'clock is 0)
                 # We want to start at angle - 180 (backwards) ? No.
                 # If moving Right (0 deg), we start at 180 (left side of circle) and sweep -180 (up/ccw?)
@@ -449,7 +800,7 @@ class Connection:
                 # we want to bulge 'Left' relative to direction? Or just always Up/Left?
                 # Let's simple fix: always counter-clockwise (+180)
                 
-                self.painter_path.arcTo(rect, -angle + 180, -180) 
+                self.painter_path.arcTo(rect, start_angle, -180) 
                 # Note: Qt angles are counter-clockwise, but Y is flipped.
                 # Visual Check required.
                 
@@ -457,92 +808,156 @@ class Connection:
             
             # Draw remaining line
             if current_dist < length:
-                self.painter_path.lineTo(p2)
-
-
-    def paint(self, painter, theme="light", zoom=1.0):
-        # Determine visual width based on selection
-        visual_width = 4.0 if self.is_selected else 2.5
-        
-        # Calculate LOGICAL width to maintain constant VISUAL width
-        pen_width = visual_width / max(0.1, zoom)
-
-        if self.is_selected:
-            color = QColor("#2563eb")
-            pen = QPen(color, pen_width)
-            brush_color = color
+                self.painter_path.lineTo(p2x, p2y)
+
+
+    def _indexed_crossings(self, seg, segment_index, order, my_index, r):
+        """Sorted, de-duplicated jump distances along seg (x1, y1, x2, y2), from the segment index."""
+        p1x, p1y, p2x, p2y = seg
+        dx = p2x - p1x
+        length = math.hypot(dx, p2y - p1y)
+        if length < 0.1:
+            return []
+
+        # Identify intersections
+        # Paths are orthogonal, so only an H/V pair can cross: test the bounds as floats
+        # Distances go into the reusable scratch buffer, filled by index
+        scratch = self._jump_scratch
+        count = 0
+        vertical = abs(dx) < 1.0
+        lo, hi = (min(p1y, p2y), max(p1y, p2y)) if vertical else (min(p1x, p2x), max(p1x, p2x))
+        envelope = (min(p1x, p2x) - r, min(p1y, p2y) - r,
+                    max(p1x, p2x) + r, max(p1y, p2y) + r)
+        for other, j in segment_index.candidates(envelope):
+            if other is self: continue
+            if my_index is not None and my_index < order[id(other)]:
+                continue
+            ox1, oy1, ox2, oy2 = other._segment_array()[j].tolist()
+            if vertical:
+                if abs(ox1 - ox2) < 1.0: continue # Parallel
+                hit = intersect_h_v(min(ox1, ox2), max(ox1, ox2), oy1, p1x, lo, hi)
+                dist = abs(hit[1] - p1y) if hit else None
+            else:
+                if abs(ox1 - ox2) >= 1.0 or oy1 == oy2: continue # Parallel or zero-length
+                hit = intersect_h_v(lo, hi, p1y, ox1, min(oy1, oy2), max(oy1, oy2))
+                dist = abs(hit[0] - p1x) if hit else None
+
+            # Filter out hits too close to start/end of segment (corners)
+            if dist is not None and r < dist < (length - r):
+                if count == len(scratch): # Double on overflow
+                    scratch = np.concatenate((scratch, np.empty_like(scratch)))
+                    self._jump_scratch = scratch
+                scratch[count] = dist
+                count += 1
+
+        intersections = scratch[:count]
+        intersections.sort()
+
+        # De-duplicate close intersections (overlapping lines)
+        # Usually every gap is wide enough and all are kept; otherwise each hit is
+        # compared with the last one kept, not just its neighbor, so walk them in order
+        if count < 2 or (np.diff(intersections) > 2.2 * r).all():
+            clean_intersections = intersections.tolist()
         else:
-            color = Qt.white if theme == "dark" else Qt.black
-            pen = QPen(color, pen_width)
-            brush_color = color
-
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
-        
-        # 1. Draw The Path (with jumps)
-        # Fallback to simple path if painter_path empty
-        if self.painter_path.isEmpty() and self.path:
-             for i in range(len(self.path)-1):
-                 painter.drawLine(self.path[i], self.path[i+1])
-        else:
-             painter.drawPath(self.painter_path)
+            ordered = intersections.tolist()
+            last_d = ordered[0]
+            clean_intersections = [last_d]
+            for d in ordered[1:]:
+                if d - last_d > 2.2 * r: # Ensure space for jump
+                    clean_intersections.append(d)
+                    last_d = d
+        return clean_intersections
+
+    def _straight_painter_path(self):
+        """painter_path without jumps: the same elements the jump loop emits when nothing crosses."""
+        segs = self._segment_array()
+        self.painter_path.moveTo(*self._pts[0].tolist())
+        lengths = np.hypot(segs[:, 2] - segs[:, 0], segs[:, 3] - segs[:, 1])
+        for x, y in segs[lengths >= 0.1, 2:].tolist():
+            self.painter_path.lineTo(x, y)
+
+    def _build_paint_cache(self, style):
+        """Arrow geometry for paint(); rebuilt only when the style pack or path changes."""
+        cache = {
+            "style": style,
+            "pts": self._pts,
+            "arrow": None,
+        }
 
-        # 2. Draw Arrow at End
-        if len(self.path) >= 2:
-            p_end = self.path[-1]
-            p_prev = self.path[-2]
+        # Arrow at End
+        if len(self._pts) >= 2:
+            (prev_x, prev_y), (end_x, end_y) = self._pts[-2:].tolist()
             
             # Vector
-            vec = p_end - p_prev
-            l = math.sqrt(vec.x()**2 + vec.y()**2)
+            dx, dy = end_x - prev_x, end_y - prev_y
+            l = math.hypot(dx, dy)
             if l > 0:
                 # Normalize
-                u = vec / l
+                ux, uy = dx / l, dy / l
                 
                 # OFFSET THE ARROW TIP
-                # Visual padding of component plate is ~6px.
-                # 10px visual gap ensures we clear the component plate in Dark Mode.
-                # In Light Mode, we only need to clear the grip radius (~4px), or users might prefer it tighter.
-                
-                visual_retract = 10.0 if theme == "dark" else 4.0
-                retract_px = visual_retract / max(0.1, zoom)
+                retract_px = style["retract"]
                 
                 if l < retract_px: 
                     retract_px = 0
                 
-                p_tip = p_end - u * retract_px
+                tip_x, tip_y = end_x - ux * retract_px, end_y - uy * retract_px
                 
                 # Arrow Geometry
                 # Maintain constant VISUAL size for the arrow
-                visual_arrow_size = 15.0
-                arrow_size = visual_arrow_size / max(0.1, zoom)
-                
-                # Perpendicular vector (-y, x)
-                perp = QPointF(-u.y(), u.x())
-                
-                p_base = p_tip - u * arrow_size
+                arrow_size = style["arrow_size"]
                 
-                p1 = p_base + perp * (arrow_size / 2.5)
-                p2 = p_base - perp * (arrow_size / 2.5)
+                # Perpendicular vector (-y, x), scaled to half the arrow width
+                half = arrow_size / 2.5
+                perp_x, perp_y = -uy * half, ux * half
                 
-                arrow_poly = QPolygonF([p_tip, p1, p2])
+                base_x, base_y = tip_x - ux * arrow_size, tip_y - uy * arrow_size
                 
-                # Draw Eraser Line to hide the "nose"
-                eraser_color = QColor("#0f172a") if theme == "dark" else Qt.white
+                p_tip = QPointF(tip_x, tip_y)
+                p1 = QPointF(base_x + perp_x, base_y + perp_y)
+                p2 = QPointF(base_x - perp_x, base_y - perp_y)
                 
-                # Eraser must be slightly thicker than the line to fully cover it
-                eraser_width = (visual_width + 1.0) / max(0.1, zoom)
-                painter.setPen(QPen(eraser_color, eraser_width))
-                painter.drawLine(p_tip, p_end)
-                
-                # Draw Arrow with High Contrast Black Border
-                # Solid Black border ensures visibility on top of EVERYTHING.
-                border_width = 1.5 / max(0.1, zoom)
-                painter.setPen(QPen(Qt.black, border_width))
-                painter.setBrush(QBrush(brush_color))
-                painter.drawPolygon(arrow_poly)
-                painter.setBrush(Qt.NoBrush) # Reset
-                painter.setPen(pen) # Restore pen
+                cache["arrow"] = {
+                    "tip": p_tip,
+                    "end": QPointF(end_x, end_y),
+                    "poly": QPolygonF([p_tip, p1, p2]),
+                }
+        return cache
+
+    def paint(self, painter, theme="light", zoom=1.0, style=None):
+        # style: this connection's pack from style_packs(theme, zoom); callers painting many
+        # connections look the pair up once and pass it in
+        if style is None:
+            style = style_packs(theme, zoom)[1 if self.is_selected else 0]
+        cache = self._paint_cache
+        if cache is None or cache["style"] is not style or cache["pts"] is not self._pts:
+            cache = self._build_paint_cache(style)
+            self._paint_cache = cache
+
+        pen = style["pen"]
+        painter.setPen(pen)
+        painter.setBrush(Qt.NoBrush)
+        
+        # 1. Draw The Path (with jumps)
+        # Fallback to simple path if painter_path empty
+        if self.painter_path.isEmpty() and self.path:
+             painter.drawPolyline(QPolygonF(self.path))
+        else:
+             painter.drawPath(self.painter_path)
+
+        # 2. Draw Arrow at End
+        arrow = cache["arrow"]
+        if arrow is not None:
+            # Draw Eraser Line to hide the "nose"
+            painter.setPen(style["eraser_pen"])
+            painter.drawLine(arrow["tip"], arrow["end"])
+            
+            # Draw Arrow with High Contrast Black Border
+            painter.setPen(style["border_pen"])
+            painter.setBrush(style["brush"])
+            painter.drawPolygon(arrow["poly"])
+            painter.setBrush(Qt.NoBrush) # Reset
+            painter.setPen(pen) # Restore pen
 
 
 
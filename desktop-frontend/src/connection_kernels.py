@@ -0,0 +1,115 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional: compute_jumps falls back to NumPy masks
+    njit = None
+
+
+def intersect_h_v(hx_min, hx_max, hy, vx, vy_min, vy_max):
+    """Crossing point of a horizontal and a vertical segment as (x, y), or None."""
+    if hx_min <= vx <= hx_max and vy_min <= hy <= vy_max:
+        return vx, hy
+    return None
+
+
+def _compute_jumps_numpy(segs, h_segs, v_segs, r):
+    """NumPy version of compute_jumps (see below)."""
+    n = segs.shape[0]
+    parts = []
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    for i in range(n):
+        x1, y1, x2, y2 = segs[i]
+        length = math.hypot(x2 - x1, y2 - y1)
+        if length < 0.1:
+            offsets[i + 1] = offsets[i]
+            continue
+
+        if abs(x1 - x2) < 1.0: # Vertical: crosses horizontal others
+            y_min, y_max = min(y1, y2), max(y1, y2)
+            hit = (h_segs[:, 0] <= x1) & (x1 <= h_segs[:, 1]) & (y_min <= h_segs[:, 2]) & (h_segs[:, 2] <= y_max)
+            dists = np.abs(h_segs[hit, 2] - y1)
+        else: # Horizontal: crosses vertical others
+            x_min, x_max = min(x1, x2), max(x1, x2)
+            hit = (v_segs[:, 1] <= y1) & (y1 <= v_segs[:, 2]) & (x_min <= v_segs[:, 0]) & (v_segs[:, 0] <= x_max)
+            dists = np.abs(v_segs[hit, 0] - x1)
+
+        # Filter out hits too close to start/end of segment (corners)
+        dists = np.sort(dists[(dists > r) & (dists < length - r)])
+
+        # De-duplicate close intersections (overlapping lines)
+        kept = []
+        for d in dists:
+            if not kept or d - kept[-1] > 2.2 * r:
+                kept.append(d)
+        parts.append(np.array(kept, dtype=np.float64))
+        offsets[i + 1] = offsets[i] + len(kept)
+
+    flat = np.concatenate(parts) if parts else np.empty(0)
+    return flat, offsets
+
+
+def _compute_jumps_loops(segs, h_segs, v_segs, r):
+    """Loop version of compute_jumps, compiled with numba when it is installed."""
+    n = segs.shape[0]
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    out = np.empty(n * max(h_segs.shape[0], v_segs.shape[0]), dtype=np.float64)
+    count = 0
+    for i in range(n):
+        x1 = segs[i, 0]
+        y1 = segs[i, 1]
+        x2 = segs[i, 2]
+        y2 = segs[i, 3]
+        length = math.hypot(x2 - x1, y2 - y1)
+        start = count
+        if length >= 0.1:
+            if abs(x1 - x2) < 1.0: # Vertical: sweep horizontal others
+                y_min = min(y1, y2)
+                y_max = max(y1, y2)
+                for k in range(h_segs.shape[0]):
+                    y = h_segs[k, 2]
+                    if h_segs[k, 0] <= x1 <= h_segs[k, 1] and y_min <= y <= y_max:
+                        d = abs(y - y1)
+                        if r < d < length - r:
+                            out[count] = d
+                            count += 1
+            else: # Horizontal: sweep vertical others
+                x_min = min(x1, x2)
+                x_max = max(x1, x2)
+                for k in range(v_segs.shape[0]):
+                    x = v_segs[k, 0]
+                    if v_segs[k, 1] <= y1 <= v_segs[k, 2] and x_min <= x <= x_max:
+                        d = abs(x - x1)
+                        if r < d < length - r:
+                            out[count] = d
+                            count += 1
+
+            # Sort and de-duplicate this segment's hits in place
+            out[start:count].sort()
+            kept = start
+            for k in range(start, count):
+                if kept == start or out[k] - out[kept - 1] > 2.2 * r:
+                    out[kept] = out[k]
+                    kept += 1
+            count = kept
+        offsets[i + 1] = count
+    return out[:count].copy(), offsets
+
+
+if njit is not None:
+    _compute_jumps = njit(cache=True)(_compute_jumps_loops)
+else:
+    _compute_jumps = _compute_jumps_numpy
+
+
+def compute_jumps(segs, h_segs, v_segs, r):
+    """
+    Jump distances for each segment of one orthogonal path.
+    segs: (n, 4) float64 rows (x1, y1, x2, y2) of the path being drawn.
+    h_segs / v_segs: (N, 3) rows (x_min, x_max, y) / (x, y_min, y_max) of the paths it may cross.
+    Returns (dists, offsets): segment i's sorted, de-duplicated distances from
+    its start point are dists[offsets[i]:offsets[i + 1]].
+    """
+    return _compute_jumps(segs, h_segs, v_segs, r)
@@ -1,18 +1,61 @@
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QFrame, QSpacerItem, QSizePolicy
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
+    QPushButton, QFrame, QSizePolicy,
+    QListView, QStyledItemDelegate, QStyle, QAbstractItemView
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QEvent
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtProperty, QEvent, QAbstractListModel, QModelIndex, QSize, QMargins, QRectF
+from PyQt5.QtGui import QColor, QPixmap, QPainter, QIcon, QPixmapCache
 
 from src.theme import apply_theme_to_screen
 from src.theme_manager import theme_manager
 from src.navigation import slide_to_index
 from src import api_client
+import os
+from collections import namedtuple
 from datetime import datetime
 import src.app_state as app_state
 
+# Layout constants shared by every card and recent-project row
+_CARD_SIZE = QSize(240, 140)
+_CARD_MARGINS = QMargins(20, 20, 20, 20)
+_CARD_SPACING = 10
+
+_ROW_MARGINS = QMargins(10, 8, 10, 8)
+_ROW_SPACING = 15  # icon / text / arrow
+_ROW_LINE_SPACING = 2  # name / time
+_ROW_DIVIDER_HEIGHT = 1
+
 # Action Card
+_CARD_RADIUS = 12
+_CARD_PADDING = QMargins(17, 17, 17, 17)  # 1px border + 16px padding
+
+
+def _color_property(name):
+    """QColor property set from the stylesheet (qproperty-<name>); repaints on change."""
+    attr = f"_{name}"
+
+    def getter(self):
+        return getattr(self, attr, QColor())
+
+    def setter(self, color):
+        setattr(self, attr, QColor(color))
+        self.update()
+
+    return pyqtProperty(QColor, getter, setter)
+
+
+def _wrap_text(text, fm, width):
+    """Break text at spaces into lines no wider than width (a longer word keeps its own line)."""
+    lines = []
+    for word in text.split():
+        line = f"{lines[-1]} {word}" if lines else word
+        if lines and fm.horizontalAdvance(line) <= width:
+            lines[-1] = line
+        else:
+            lines.append(word)
+    return "\n".join(lines)
+
+
 class ActionCard(QFrame):
     """A clickable card widget that acts as a large button."""
     clicked = pyqtSignal()
@@ -22,11 +65,15 @@ class ActionCard(QFrame):
 
         self.setObjectName("actionCard")
         self.setCursor(Qt.PointingHandCursor)
-        self.setFixedSize(240, 140)
+        # Software-painted: never promote the page to native windows on its behalf
+        self.setAttribute(Qt.WA_DontCreateNativeAncestors, True)
+        # Fixed policy + constant size hints instead of min/max constraints
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
 
+        self.setContentsMargins(_CARD_PADDING)
         layout = QVBoxLayout(self)
-        layout.setContentsMargins(20, 20, 20, 20)
-        layout.setSpacing(10)
+        layout.setContentsMargins(_CARD_MARGINS)
+        layout.setSpacing(_CARD_SPACING)
 
         # Icon
         icon_label = QLabel(icon_text)
@@ -40,14 +87,77 @@ class ActionCard(QFrame):
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
 
-        # Description
-        desc_label = QLabel(description)
-        desc_label.setObjectName("cardDesc")
-        desc_label.setAlignment(Qt.AlignCenter)
-        desc_label.setWordWrap(True)
-        layout.addWidget(desc_label)
+        # Description: broken into lines once the stylesheet font is known (see showEvent)
+        self._description = description
+        self.desc_label = QLabel(description)
+        self.desc_label.setObjectName("cardDesc")
+        self.desc_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.desc_label)
+        self.setToolTip(description)
+
+        # Keep the labels at their natural height, stacked from the top
+        layout.setAlignment(Qt.AlignTop)
+
+        # Only the card itself takes hover and clicks; the labels are decoration
+        for label in (icon_label, title_label, self.desc_label):
+            label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+
+    # Theme colors come from styles.qss (QFrame#actionCard)
+    cardBackground = _color_property("cardBackground")
+    cardBorder = _color_property("cardBorder")
+    cardHoverBackground = _color_property("cardHoverBackground")
+    cardHoverBorder = _color_property("cardHoverBorder")
+
+    def _background(self, hovered):
+        # The rounded background is drawn once per size/colors and shared by all cards
+        if hovered:
+            bg, border = self.cardHoverBackground, self.cardHoverBorder
+        else:
+            bg, border = self.cardBackground, self.cardBorder
+        ratio = self.devicePixelRatioF()
+        key = (f"card:{self.width()}x{self.height()}:{bg.name(QColor.HexArgb)}:"
+               f"{border.name(QColor.HexArgb)}:{ratio}")
+        pm = QPixmapCache.find(key)
+        if pm is None:
+            pm = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+            pm.setDevicePixelRatio(ratio)
+            pm.fill(Qt.transparent)
+            p = QPainter(pm)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setBrush(bg)
+            p.setPen(border)
+            p.drawRoundedRect(QRectF(0.5, 0.5, self.width() - 1, self.height() - 1), _CARD_RADIUS, _CARD_RADIUS)
+            p.end()
+            QPixmapCache.insert(key, pm)
+        return pm
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._background(self.underMouse()))
+
+    def enterEvent(self, event):
+        self.update()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.update()
+        super().leaveEvent(event)
+
+    def sizeHint(self):
+        return _CARD_SIZE
+
+    def minimumSizeHint(self):
+        return _CARD_SIZE
 
-        layout.addStretch()
+    def showEvent(self, event):
+        # The card width is fixed, so the text is wrapped once, after the label
+        # has been polished with its stylesheet font, instead of on every resize
+        if self._description is not None:
+            width = (_CARD_SIZE.width() - _CARD_PADDING.left() - _CARD_PADDING.right()
+                     - _CARD_MARGINS.left() - _CARD_MARGINS.right())
+            self.desc_label.setText(_wrap_text(self._description, self.desc_label.fontMetrics(), width))
+            self._description = None
+        super().showEvent(event)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -55,52 +165,134 @@ class ActionCard(QFrame):
         super().mousePressEvent(event)
 
 
-# Recent Project Item
-class RecentProjectItem(QWidget):
-    """A row item showing a recent project."""
-    clicked = pyqtSignal(int)  # Changed to emit project ID instead of name
+# Recent Projects List
+# Rows are plain data painted by RecentProjectDelegate, so no per-row widgets are built
+ProjectIdRole = Qt.UserRole + 1
 
-    def __init__(self, project_id, project_name, last_opened, parent=None):
-        super().__init__(parent)
+RecentProject = namedtuple("RecentProject", "project_id name last_opened")
 
-        self.setAttribute(Qt.WA_StyledBackground, True)
-        self.setCursor(Qt.PointingHandCursor)
-        self.project_id = project_id
-        self.project_name = project_name
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(10, 8, 10, 8)
-        layout.setSpacing(15)
+class RecentProjectsModel(QAbstractListModel):
+    """RecentProject rows for the recent projects list, held as an immutable tuple."""
 
-        # Icon
-        icon_label = QLabel("📄")
-        icon_label.setObjectName("recentIcon")
-        layout.addWidget(icon_label)
-
-        # Text info
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(2)
-
-        name_label = QLabel(project_name)
-        name_label.setObjectName("recentName")
-        info_layout.addWidget(name_label)
+    def __init__(self, projects=(), parent=None):
+        super().__init__(parent)
+        self._projects = tuple(projects)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._projects)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        project = self._projects[index.row()]
+        if role == Qt.DisplayRole:
+            return project.name
+        if role == Qt.UserRole:
+            return project.last_opened
+        if role == ProjectIdRole:
+            return project.project_id
+        return None
+
+    def set_projects(self, projects):
+        self.beginResetModel()
+        self._projects = tuple(projects)
+        self.endResetModel()
+
+
+class RecentProjectsView(QListView):
+    """List of recent projects; row colors come from styles.qss (QListView#recentList)."""
+    iconColor = _color_property("iconColor")
+    nameColor = _color_property("nameColor")
+    timeColor = _color_property("timeColor")
+    arrowColor = _color_property("arrowColor")
+    hoverColor = _color_property("hoverColor")
+    dividerColor = _color_property("dividerColor")
+
+
+# Row icons: SVGs from ui/res, tinted and rasterized once per (name, color, size, pixel ratio).
+# The text glyph is only drawn when the SVG cannot be loaded.
+_ICON_GLYPHS = {"document": "📄", "arrow_right": "→"}
+_icon_cache = {}
+_icon_pixmap_cache = {}
+
+def _icon(name):
+    icon = _icon_cache.get(name)
+    if icon is None:
+        icon = QIcon(os.path.join("ui", "res", f"{name}.svg"))
+        _icon_cache[name] = icon
+    return icon
+
+def _icon_pixmap(name, color, size, font, ratio):
+    key = (name, color.rgba(), size, ratio)
+    pixmap = _icon_pixmap_cache.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(max(1, round(size * ratio)), max(1, round(size * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        p = QPainter(pixmap)
+        icon = _icon(name)
+        if not icon.isNull():
+            icon.paint(p, 0, 0, size, size)
+            # Recolor the black artwork with the theme color
+            p.setCompositionMode(QPainter.CompositionMode_SourceIn)
+            p.fillRect(0, 0, size, size, QColor(color))
+        else:
+            p.setFont(font)
+            p.setPen(QColor(color))
+            p.drawText(0, 0, size, size, Qt.AlignCenter, _ICON_GLYPHS[name])
+        p.end()
+        _icon_pixmap_cache[key] = pixmap
+    return pixmap
+
+
+class RecentProjectDelegate(QStyledItemDelegate):
+    """Paints a recent project row: icon, name over last-opened time, and an arrow."""
+
+    def sizeHint(self, option, index):
+        fm = option.fontMetrics
+        return QSize(option.rect.width(),
+                     _ROW_MARGINS.top() + 2 * fm.height() + _ROW_LINE_SPACING
+                     + _ROW_MARGINS.bottom() + _ROW_DIVIDER_HEIGHT)
+
+    def paint(self, painter, option, index):
+        view = self.parent()
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        painter.save()
+        painter.setFont(option.font)
+        fm = option.fontMetrics
+        rect = option.rect.marginsRemoved(_ROW_MARGINS).adjusted(0, 0, 0, -_ROW_DIVIDER_HEIGHT)
+
+        # Divider under the row, drawn here rather than as a widget of its own
+        painter.fillRect(option.rect.left(), option.rect.bottom() - _ROW_DIVIDER_HEIGHT + 1,
+                         option.rect.width(), _ROW_DIVIDER_HEIGHT, view.dividerColor)
+
+        # Icon and arrow are blitted from cached pixmaps, one line tall
+        ratio = painter.device().devicePixelRatioF()
+        icon_size = fm.height()
+        icon_top = rect.top() + (rect.height() - icon_size) // 2
+        icon_width = arrow_width = icon_size
+        painter.drawPixmap(rect.left(), icon_top,
+                           _icon_pixmap("document", view.iconColor, icon_size, option.font, ratio))
 
-        time_label = QLabel(last_opened)
-        time_label.setObjectName("recentTime")
-        info_layout.addWidget(time_label)
+        # Arrow
+        painter.drawPixmap(rect.right() - arrow_width, icon_top,
+                           _icon_pixmap("arrow_right", view.arrowColor, icon_size, option.font, ratio))
 
-        layout.addLayout(info_layout)
-        layout.addStretch()
+        # Text info: name over last opened time
+        text_left = rect.left() + icon_width + _ROW_SPACING
+        text_width = rect.right() - arrow_width - _ROW_SPACING - text_left
+        line_height = fm.height()
 
-        # Arrow
-        arrow_label = QLabel("→")
-        arrow_label.setObjectName("recentArrow")
-        layout.addWidget(arrow_label)
+        painter.setPen(view.hoverColor if hovered else view.nameColor)
+        name = fm.elidedText(index.data(Qt.DisplayRole) or "", Qt.ElideRight, text_width)
+        painter.drawText(text_left, rect.top(), text_width, line_height, Qt.AlignLeft | Qt.AlignVCenter, name)
 
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self.clicked.emit(self.project_id)  # Emit ID instead of name
-        super().mousePressEvent(event)
+        painter.setPen(view.timeColor)
+        painter.drawText(text_left, rect.top() + line_height + _ROW_LINE_SPACING, text_width, line_height,
+                         Qt.AlignLeft | Qt.AlignVCenter, index.data(Qt.UserRole) or "")
+        painter.restore()
 
 
 # Landing Page Screen
@@ -113,17 +305,40 @@ class LandingPage(QWidget):
         self.setObjectName("landingPage")
 
         # ROOT layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
+        self.root_layout = QVBoxLayout(self)
+        self.root_layout.setContentsMargins(0, 0, 0, 0)
+
+        # The page's widgets are built the first time it is shown (see showEvent)
+        self._built = False
+
+        # Connect to theme manager
+        theme_manager.theme_changed.connect(self.on_theme_changed)
+
+        # Apply initial theme
+        self.on_theme_changed(theme_manager.current_theme)
+
+    def _build_ui(self):
+        """Builds the page contents; runs once, on the first showEvent."""
+        # Coalesce the invalidations of every addWidget/polish below into one repaint
+        self.setUpdatesEnabled(False)
+        layout = self.root_layout
 
         # Background area
         self.bgwidget = QWidget(self)
         self.bgwidget.setObjectName("bgwidget")
+        self.bgwidget.setAttribute(Qt.WA_DontCreateNativeAncestors, True)
+        # Theme the background before any child exists, so each child resolves the
+        # stylesheet once when first shown instead of being re-polished afterwards
+        self.bgwidget.setProperty("theme", app_state.current_theme)
         layout.addWidget(self.bgwidget)
 
-        # Content layout inside bgwidget
-        self.content_layout = QVBoxLayout(self.bgwidget)
+        # Content grid inside bgwidget: header on top, center column flanked by
+        # stretch columns, and a stretch row below
+        self.content_layout = QGridLayout(self.bgwidget)
         self.content_layout.setContentsMargins(40, 40, 40, 40)
+        self.content_layout.setColumnStretch(0, 1)
+        self.content_layout.setColumnStretch(2, 1)
+        self.content_layout.setRowStretch(2, 1)
 
         # HEADER BAR
         header_bar = QWidget(self.bgwidget)
@@ -131,15 +346,14 @@ class LandingPage(QWidget):
 
         header_layout = QHBoxLayout(header_bar)
         header_layout.setContentsMargins(10, 0, 10, 0)
-        header_layout.addStretch()
 
         # Logout button
         self.logout_btn = QPushButton("Logout")
         self.logout_btn.setObjectName("logoutButton")
         self.logout_btn.setCursor(Qt.PointingHandCursor)
-        header_layout.addWidget(self.logout_btn)
+        header_layout.addWidget(self.logout_btn, 0, Qt.AlignRight)
 
-        self.content_layout.addWidget(header_bar)
+        self.content_layout.addWidget(header_bar, 0, 0, 1, 3)
 
         # CENTER CONTENT
         center_widget = QWidget()
@@ -193,45 +407,43 @@ class LandingPage(QWidget):
         self.recent_layout.setSpacing(0)
         center_layout.addWidget(self.recent_container)
 
-
-        # placeholder_projects = [
-        #     ("Distillation_Unit_A.pfd", "2 hours ago"),
-        #     ("Heat_Exchanger_Network.pfd", "Yesterday"),
-        #     ("Reactor_Setup_V2.pfd", "3 days ago")
-        # ]
-
-        # for name, time in placeholder_projects:
-        #     item = RecentProjectItem(name, time)
-        #     recent_layout.addWidget(item)
-
-        #     # Divider
-        #     line = QFrame()
-        #     line.setFrameShape(QFrame.HLine)
-        #     line.setObjectName("divider")
-        #     recent_layout.addWidget(line)
-
-        # center_layout.addWidget(recent_container)
-
-        # Center alignment
-        h = QHBoxLayout()
-        h.addStretch()
-        h.addWidget(center_widget)
-        h.addStretch()
-
-        self.content_layout.addLayout(h)
-        self.content_layout.addStretch()
-
-        # Connect to theme manager
-        theme_manager.theme_changed.connect(self.on_theme_changed)
-        
-        # Apply initial theme
-        self.on_theme_changed(theme_manager.current_theme)
+        # Rows are painted on demand by the delegate instead of one widget each
+        self.recent_model = RecentProjectsModel()
+        self.recent_view = RecentProjectsView()
+        self.recent_view.setObjectName("recentList")
+        self.recent_view.setModel(self.recent_model)
+        self.recent_view.setItemDelegate(RecentProjectDelegate(self.recent_view))
+        self.recent_view.setUniformItemSizes(True)
+        self.recent_view.setFrameShape(QFrame.NoFrame)
+        self.recent_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.recent_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.recent_view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.recent_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.recent_view.setMouseTracking(True)
+        self.recent_view.viewport().setCursor(Qt.PointingHandCursor)
+        self.recent_view.clicked.connect(
+            lambda index: self.on_recent_project_clicked(index.data(ProjectIdRole))
+        )
+        self.recent_layout.addWidget(self.recent_view)
+
+        self.recent_empty = QLabel("No recent projects")
+        self.recent_empty.setAlignment(Qt.AlignCenter)
+        self.recent_empty.setObjectName("emptyRecent")
+        self.recent_empty.hide()
+        self.recent_layout.addWidget(self.recent_empty)
+
+        self.content_layout.addWidget(center_widget, 1, 1)
+
+        self.setUpdatesEnabled(True)
 
         # Logout
         self.logout_btn.clicked.connect(self.on_logout_clicked)
 
     def showEvent(self, event):
         """Called when the widget becomes visible (e.g. after login)."""
+        if not self._built:
+            self._build_ui()
+            self._built = True
         super().showEvent(event)
         self.load_recent_projects()
 
@@ -250,41 +462,28 @@ class LandingPage(QWidget):
         
     def load_recent_projects(self):
         """Load recent projects from backend API."""
-        while self.recent_layout.count():
-            item = self.recent_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
         projects = api_client.get_projects()
         print(f"[DEBUG] Got {len(projects)} projects")
         print(f"[DEBUG] First project: {projects[0] if projects else 'None'}")
 
-
-        if not projects:
-            empty = QLabel("No recent projects")
-            empty.setAlignment(Qt.AlignCenter)
-            empty.setObjectName("emptyRecent")
-            self.recent_layout.addWidget(empty)
-            return
-
         # Sort by updated_at (most recent first)
         projects.sort(key=lambda x: x.get("updated_at", ""), reverse=True)
-        
+
         # Show only latest 5 projects
-        for proj in projects[:5]:
-            project_id = proj.get("id")
-            name = proj.get("name", "Untitled Project")
-            updated = proj.get("updated_at", "")
-            time_label = self._format_time(updated)
-
-            item = RecentProjectItem(project_id, name, time_label)
-            item.clicked.connect(self.on_recent_project_clicked)
-            self.recent_layout.addWidget(item)
-
-            divider = QFrame()
-            divider.setFrameShape(QFrame.HLine)
-            divider.setObjectName("divider")
-            self.recent_layout.addWidget(divider)
+        rows = tuple(
+            RecentProject(proj.get("id"), proj.get("name", "Untitled Project"),
+                          self._format_time(proj.get("updated_at", "")))
+            for proj in projects[:5]
+        )
+        self.recent_container.setUpdatesEnabled(False)
+        self.recent_model.set_projects(rows)
+
+        # Fit the view to its rows; the page scrolls, not the list
+        self.recent_view.setVisible(bool(rows))
+        self.recent_empty.setVisible(not rows)
+        if rows:
+            self.recent_view.setFixedHeight(len(rows) * self.recent_view.sizeHintForRow(0))
+        self.recent_container.setUpdatesEnabled(True)
 
     def on_recent_project_clicked(self, project_id: int):
         """Handle click on recent project - navigate to canvas and load project."""
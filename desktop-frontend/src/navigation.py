@@ -1,6 +1,70 @@
 from PyQt5.QtCore import QPropertyAnimation, QRect, QEasingCurve
+from PyQt5.QtWidgets import QStackedWidget, QWidget
 import src.app_state as app_state
 
+
+class ScreenStack(QStackedWidget):
+    """
+    QStackedWidget whose pages can be registered as factories.
+    A lazy page holds an empty placeholder until it is first requested
+    (via widget(), setCurrentIndex() or screen()), so screens that are
+    never visited in a session are never constructed.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._indices = {}    # name -> index
+        self._factories = {}  # index -> callable returning the screen
+
+    def add_screen(self, name, screen):
+        index = self.addWidget(screen)
+        self._indices[name] = index
+        return index
+
+    def add_lazy_screen(self, name, factory):
+        index = self.addWidget(QWidget())
+        self._indices[name] = index
+        self._factories[index] = factory
+        return index
+
+    def screen(self, name):
+        """Return the named screen, constructing it on first access."""
+        return self.widget(self._indices[name])
+
+    def widget(self, index):
+        self._materialize(index)
+        return super().widget(index)
+
+    def setCurrentIndex(self, index):
+        self._materialize(index)
+        super().setCurrentIndex(index)
+
+    def _materialize(self, index):
+        factory = self._factories.pop(index, None)
+        if factory is None:
+            return
+        placeholder = super().widget(index)
+        # Insert before the placeholder, then drop it, so indices never shift
+        self.insertWidget(index, factory())
+        self.removeWidget(placeholder)
+        placeholder.deleteLater()
+
+
+class ScreenRegistry:
+    """Name -> screen lookup for app_state.screens backed by a ScreenStack."""
+
+    def __init__(self, stack):
+        self._stack = stack
+
+    def __getitem__(self, name):
+        return self._stack.screen(name)
+
+    def get(self, name, default=None):
+        try:
+            return self._stack.screen(name)
+        except KeyError:
+            return default
+
 def slide_to_index(target_index, direction=1):
     """
     Slide animation when switching pages in the QStackedWidget.
@@ -13,7 +13,9 @@ def apply_theme_to_screen(screen, theme=None):
         app_state.current_theme = theme
 
     bg = screen.findChild(QtWidgets.QWidget, "bgwidget")
-    if bg is not None:
+    # Re-polishing re-resolves the app stylesheet for every child; skip it when
+    # this screen already shows the theme (widgets added since polish themselves)
+    if bg is not None and bg.property("theme") != theme:
         bg.setProperty("theme", theme)
         bg.style().unpolish(bg)
         bg.style().polish(bg)
@@ -0,0 +1,57 @@
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5.QtGui import QImage
+from PyQt5.QtWidgets import QApplication, QLabel
+
+from src.canvas.export import get_content_rect, render_to_image, render_to_png_banded
+
+app = QApplication.instance() or QApplication([])
+
+
+class MockCanvas:
+    def __init__(self):
+        self.components = []
+        self.connections = []
+        self.zoom_level = 1.0
+
+    def add(self, x, y, w, h, color):
+        comp = QLabel("PFD")
+        comp.setStyleSheet(f"background: {color}; color: white;")
+        comp.setGeometry(x, y, w, h)
+        self.components.append(comp)
+
+
+def _canvas():
+    canvas = MockCanvas()
+    # Spread over several bands, with edges falling inside and across band boundaries
+    canvas.add(0, 0, 60, 45, "#c0392b")
+    canvas.add(40, 30, 80, 50, "#2980b9")
+    canvas.add(10, 95, 120, 33, "#27ae60")
+    canvas.add(90, 140, 35, 70, "#8e44ad")
+    return canvas
+
+
+def test_banded_png_matches_render_to_image(tmp_path):
+    canvas = _canvas()
+    rect = get_content_rect(canvas, padding=7)
+
+    for scale, band_height in ((1.0, 16), (3.0, 37)):
+        filename = str(tmp_path / f"banded_{scale}.png")
+        render_to_png_banded(canvas, rect, filename, scale=scale, band_height=band_height)
+
+        expected = render_to_image(canvas, rect, scale=scale)
+        loaded = QImage(filename)
+        assert not loaded.isNull()
+        assert loaded.convertToFormat(QImage.Format_RGB32) == expected
+        # Same pHYs density as the QImage.save() export path
+        with open(filename, "rb") as f:
+            data = f.read()
+        assert data.index(b"pHYs") < data.index(b"IDAT")
+        assert loaded.dotsPerMeterX() == expected.dotsPerMeterX()
+        assert loaded.dotsPerMeterY() == expected.dotsPerMeterY()